@@ -20,7 +20,7 @@ setup(
     url="https://github.com/mooazn/Ward",
     license="MIT",
     packages=find_packages(exclude=["tests", "tests.*", "examples"]),
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=[
         # No runtime dependencies - intentionally minimal
     ],
@@ -30,15 +30,20 @@ setup(
             "pytest-cov>=4.0.0",
             "black>=23.0.0",
         ],
+        # Optional DFA-based multi-pattern matching for command screening
+        "fast-match": [
+            "hyperscan>=0.7.0",
+        ],
+        # Optional fast JSON parsing for audit-log reads
+        "fast-json": [
+            "orjson>=3.8.0",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -4,5 +4,12 @@ Agent adapters for Ward control plane
 
 from .shell_agent import ShellAgent, ExecutionResult
 from .async_agent import AsyncAgent, PendingApproval
+from .poller import ApprovalPoller
 
-__all__ = ["ShellAgent", "ExecutionResult", "AsyncAgent", "PendingApproval"]
+__all__ = [
+    "ShellAgent",
+    "ExecutionResult",
+    "AsyncAgent",
+    "PendingApproval",
+    "ApprovalPoller",
+]
@@ -0,0 +1,137 @@
+"""
+Launcher - persistent sidecar workers for shell command execution
+
+Spawning a fresh process per command pays fork+exec every time, which
+dominates the cost of short commands. A launcher worker is forked once
+(as `python -u -m ward.agent._launcher`) and then executes many commands
+over a line-delimited JSON protocol on stdin/stdout:
+
+    request:  {"cmd": "<command>", "timeout": <seconds>}
+    response: {"exit_code": int, "stdout": str, "stderr": str}
+              or {"timeout": true} or {"error": "<message>"}
+
+_LauncherPool owns the workers and is used by ShellAgent when
+constructed with use_launcher=True.
+"""
+
+import json
+import queue
+import shlex
+import subprocess
+import sys
+import threading
+
+
+class _LauncherPool:
+    """
+    Pool of persistent launcher workers.
+
+    Workers are checked out per command and returned afterwards; a dead
+    worker is replaced transparently on checkout.
+    """
+
+    def __init__(self, size: int = 1):
+        self._available: queue.Queue = queue.Queue()
+        self._spawn_lock = threading.Lock()
+        for _ in range(size):
+            self._available.put(self._spawn())
+
+    def _spawn(self) -> subprocess.Popen:
+        """Start one launcher worker"""
+        with self._spawn_lock:
+            return subprocess.Popen(
+                [sys.executable, "-u", "-m", "ward.agent._launcher"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+
+    def run(self, command: str, timeout: int = 30) -> tuple:
+        """
+        Execute a command on a pooled worker.
+
+        Args:
+            command: Shell command to execute
+            timeout: Seconds before the worker aborts the command
+
+        Returns:
+            (exit_code, stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command timed out
+            RuntimeError: If the worker reported an execution error
+        """
+        worker = self._available.get()
+        try:
+            if worker.poll() is not None:
+                worker = self._spawn()
+
+            worker.stdin.write(
+                json.dumps({"cmd": command, "timeout": timeout}) + "\n"
+            )
+            worker.stdin.flush()
+
+            line = worker.stdout.readline()
+            if not line:
+                raise RuntimeError("Launcher worker exited unexpectedly")
+            response = json.loads(line)
+        finally:
+            self._available.put(worker)
+
+        if response.get("timeout"):
+            raise subprocess.TimeoutExpired(command, timeout)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+
+        return response["exit_code"], response["stdout"], response["stderr"]
+
+    def shutdown(self) -> None:
+        """Terminate all idle workers"""
+        while True:
+            try:
+                worker = self._available.get_nowait()
+            except queue.Empty:
+                break
+            worker.terminate()
+
+
+def main() -> None:
+    """Worker loop: one JSON request per line in, one response out"""
+    # Imported lazily so pool construction doesn't recurse into the
+    # agent package
+    from ward.agent.shell_agent import _needs_shell
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            command = request["cmd"]
+            timeout = request.get("timeout", 30)
+
+            needs_shell = _needs_shell(command)
+            result = subprocess.run(
+                command if needs_shell else shlex.split(command),
+                shell=needs_shell,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            response = {
+                "exit_code": result.returncode,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+            }
+        except subprocess.TimeoutExpired:
+            response = {"timeout": True}
+        except Exception as e:
+            response = {"error": str(e)}
+
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,22 @@ Provides the common pattern of:
 4. Executing once approved
 """
 
+import array
+import asyncio
+import threading
 import time
 from typing import Dict, Any, List, Optional, Callable
-from datetime import datetime
 
 from ward.storage import SQLiteAuditBackend
 
 
 class PendingApproval:
-    """Represents an action awaiting human approval"""
+    """
+    A view of an action awaiting human approval.
+
+    The queue itself is stored column-wise inside AsyncAgent; this object
+    is only materialized for callers that want a record per entry.
+    """
 
     def __init__(
         self,
@@ -54,8 +61,41 @@ class AsyncAgent:
         self.backend = backend
         self.poll_interval = poll_interval
 
-        # Pending approvals queue: decision_id → PendingApproval
-        self.pending_approvals: Dict[str, PendingApproval] = {}
+        # Pending approvals in struct-of-arrays layout: parallel columns
+        # indexed by position, plus decision_id -> index for O(1) lookup.
+        # Avoids allocating one PendingApproval object per queued entry.
+        self._dec_ids: List[str] = []
+        self._action_names: List[str] = []
+        self._action_args: List[Dict[str, Any]] = []
+        self._callback_data: List[Dict[str, Any]] = []
+        # Packed doubles (8 bytes/entry, contiguous) rather than one
+        # boxed float object per timestamp
+        self._requested_at = array.array("d")
+        self._index: Dict[str, int] = {}
+        # Guards the columns above: ApprovalPoller resolves statuses
+        # from its background thread while the owning thread may still
+        # be queueing new approvals. Reentrant because resolution
+        # removes rows while already holding it.
+        self._pending_lock = threading.RLock()
+
+    @property
+    def pending_approvals(self) -> Dict[str, PendingApproval]:
+        """
+        Dict view of the pending queue (decision_id -> PendingApproval).
+
+        Materialized on access; use the accessor methods in hot paths.
+        """
+        with self._pending_lock:
+            return {
+                dec_id: PendingApproval(
+                    decision_id=dec_id,
+                    action_name=self._action_names[i],
+                    action_args=self._action_args[i],
+                    requested_at=self._requested_at[i],
+                    callback_data=self._callback_data[i],
+                )
+                for dec_id, i in self._index.items()
+            }
 
     def add_pending_approval(
         self,
@@ -73,13 +113,47 @@ class AsyncAgent:
             action_args: Arguments for the action
             callback_data: Optional data to pass to execution callback
         """
-        self.pending_approvals[decision_id] = PendingApproval(
-            decision_id=decision_id,
-            action_name=action_name,
-            action_args=action_args,
-            requested_at=time.time(),
-            callback_data=callback_data,
-        )
+        with self._pending_lock:
+            if decision_id in self._index:
+                # Replace in place
+                i = self._index[decision_id]
+                self._action_names[i] = action_name
+                self._action_args[i] = action_args
+                self._callback_data[i] = callback_data or {}
+                self._requested_at[i] = time.time()
+                return
+
+            self._index[decision_id] = len(self._dec_ids)
+            self._dec_ids.append(decision_id)
+            self._action_names.append(action_name)
+            self._action_args.append(action_args)
+            self._callback_data.append(callback_data or {})
+            self._requested_at.append(time.time())
+
+    def _remove_pending(self, decision_id: str) -> None:
+        """Remove an entry by swapping the tail row into its slot"""
+        with self._pending_lock:
+            i = self._index.pop(decision_id)
+            last = len(self._dec_ids) - 1
+
+            if i != last:
+                self._dec_ids[i] = self._dec_ids[last]
+                self._action_names[i] = self._action_names[last]
+                self._action_args[i] = self._action_args[last]
+                self._callback_data[i] = self._callback_data[last]
+                self._requested_at[i] = self._requested_at[last]
+                self._index[self._dec_ids[i]] = i
+
+            self._dec_ids.pop()
+            self._action_names.pop()
+            self._action_args.pop()
+            self._callback_data.pop()
+            self._requested_at.pop()
+
+    def get_pending_ids(self) -> List[str]:
+        """Snapshot of pending decision IDs, safe to read cross-thread"""
+        with self._pending_lock:
+            return list(self._dec_ids)
 
     def check_pending_approvals(
         self, execute_callback: Callable[[str, Dict[str, Any], str], Any]
@@ -94,76 +168,149 @@ class AsyncAgent:
         Returns:
             List of processed approvals with their results
         """
-        if not self.pending_approvals:
+        pending_ids = self.get_pending_ids()
+        if not pending_ids:
             return []
 
+        # One batched query for all pending decisions instead of up to
+        # three round-trips per decision. Only decisions whose state
+        # changed come back, so resolution is O(changed) not O(pending).
+        statuses = self.backend.poll_decisions(pending_ids)
+
+        return self._resolve_statuses(statuses, execute_callback)
+
+    def _resolve_statuses(
+        self,
+        statuses: Dict[str, tuple],
+        execute_callback: Callable[[str, Dict[str, Any], str], Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply already-fetched decision statuses to the pending queue.
+
+        Shared by check_pending_approvals and ApprovalPoller, which
+        batches the status query across many agents.
+        """
         results = []
+        approved = []
+
+        # Pop resolved rows while holding the lock; approved callbacks
+        # run after release so a slow execution doesn't block another
+        # thread queueing or resolving approvals
+        with self._pending_lock:
+            for decision_id, (status, lease_id) in statuses.items():
+                i = self._index.get(decision_id)
+                if i is None:
+                    continue
 
-        for decision_id in list(self.pending_approvals.keys()):
-            approval = self.pending_approvals[decision_id]
-
-            # Check for denial first
-            if self.backend.is_decision_denied(decision_id):
-                self.pending_approvals.pop(decision_id)
-                results.append(
-                    {
-                        "decision_id": decision_id,
-                        "action_name": approval.action_name,
-                        "action_args": approval.action_args,
-                        "callback_data": approval.callback_data,
-                        "result": "Action was denied by human operator",
-                        "status": "denied",
-                    }
+                row = {
+                    "decision_id": decision_id,
+                    "action_name": self._action_names[i],
+                    "action_args": self._action_args[i],
+                    "callback_data": self._callback_data[i],
+                }
+
+                if status == "denied":
+                    self._remove_pending(decision_id)
+                    row["result"] = "Action was denied by human operator"
+                    row["status"] = "denied"
+                    results.append(row)
+                elif status == "revoked":
+                    self._remove_pending(decision_id)
+                    row["result"] = "Action was revoked by human operator"
+                    row["status"] = "revoked"
+                    results.append(row)
+                elif status == "approved" and lease_id:
+                    # Approved and not revoked - execute!
+                    self._remove_pending(decision_id)
+                    approved.append((row, lease_id))
+
+        for row, lease_id in approved:
+            try:
+                row["result"] = execute_callback(
+                    row["action_name"], row["action_args"], lease_id
                 )
-                continue
-
-            # Check for approval
-            lease_id = self.backend.check_decision_approved(decision_id)
-
-            if lease_id:
-                # Check if lease was revoked
-                if self.backend.is_lease_revoked(lease_id):
-                    self.pending_approvals.pop(decision_id)
-                    results.append(
-                        {
-                            "decision_id": decision_id,
-                            "action_name": approval.action_name,
-                            "action_args": approval.action_args,
-                            "callback_data": approval.callback_data,
-                            "result": "Action was revoked by human operator",
-                            "status": "revoked",
-                        }
-                    )
+                row["status"] = "executed"
+            except Exception as e:
+                row["result"] = f"Execution error: {str(e)}"
+                row["status"] = "error"
+            results.append(row)
+
+        return results
+
+    async def check_pending_approvals_async(
+        self,
+        execute_callback: Callable[[str, Dict[str, Any], str], Any],
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of check_pending_approvals.
+
+        Approved actions run concurrently (capped by `concurrency`), so
+        IO-bound callbacks overlap instead of executing back to back.
+
+        Args:
+            execute_callback: Coroutine function called when an action is
+                             approved. Signature:
+                             (action_name, action_args, lease_id) -> result
+            concurrency: Maximum callbacks in flight at once
+
+        Returns:
+            List of processed approvals with their results
+        """
+        pending_ids = self.get_pending_ids()
+        if not pending_ids:
+            return []
+
+        results = []
+        approved = []
+
+        statuses = self.backend.poll_decisions(pending_ids)
+
+        with self._pending_lock:
+            for decision_id, (status, lease_id) in statuses.items():
+                i = self._index.get(decision_id)
+                if i is None:
                     continue
 
-                # Approved and not revoked - execute!
-                self.pending_approvals.pop(decision_id)
-
-                try:
-                    result = execute_callback(
-                        approval.action_name, approval.action_args, lease_id
-                    )
-                    results.append(
-                        {
-                            "decision_id": decision_id,
-                            "action_name": approval.action_name,
-                            "action_args": approval.action_args,
-                            "callback_data": approval.callback_data,
-                            "result": result,
-                            "status": "executed",
-                        }
-                    )
-                except Exception as e:
-                    results.append(
-                        {
-                            "decision_id": decision_id,
-                            "action_name": approval.action_name,
-                            "action_args": approval.action_args,
-                            "callback_data": approval.callback_data,
-                            "result": f"Execution error: {str(e)}",
-                            "status": "error",
-                        }
-                    )
+                row = {
+                    "decision_id": decision_id,
+                    "action_name": self._action_names[i],
+                    "action_args": self._action_args[i],
+                    "callback_data": self._callback_data[i],
+                }
+
+                if status == "denied":
+                    self._remove_pending(decision_id)
+                    row["result"] = "Action was denied by human operator"
+                    row["status"] = "denied"
+                    results.append(row)
+                elif status == "revoked":
+                    self._remove_pending(decision_id)
+                    row["result"] = "Action was revoked by human operator"
+                    row["status"] = "revoked"
+                    results.append(row)
+                elif status == "approved" and lease_id:
+                    self._remove_pending(decision_id)
+                    approved.append((row, lease_id))
+
+        if approved:
+            sem = asyncio.Semaphore(concurrency)
+
+            async def run(row: Dict[str, Any], lease_id: str) -> Dict[str, Any]:
+                async with sem:
+                    try:
+                        row["result"] = await execute_callback(
+                            row["action_name"], row["action_args"], lease_id
+                        )
+                        row["status"] = "executed"
+                    except Exception as e:
+                        row["result"] = f"Execution error: {str(e)}"
+                        row["status"] = "error"
+                    return row
+
+            results.extend(
+                await asyncio.gather(*(run(row, lid) for row, lid in approved))
+            )
 
         return results
 
@@ -185,28 +332,50 @@ class AsyncAgent:
         all_results = []
         start_time = time.time()
 
-        while self.pending_approvals:
+        # Adaptive backoff: poll eagerly right after changes (fast
+        # approvals resolve in tens of milliseconds), doubling toward
+        # poll_interval while nothing is happening
+        min_interval = min(0.05, self.poll_interval)
+        interval = min_interval
+
+        while self._dec_ids:
             # Check timeout
             if timeout and (time.time() - start_time) > timeout:
                 break
 
-            # Wait before polling
-            time.sleep(self.poll_interval)
+            # Sleep until the backend signals a write (or the backoff
+            # interval elapses as a safety net for out-of-process writers)
+            self.backend.wait_for_update(timeout=interval)
 
             # Check for status changes
             results = self.check_pending_approvals(execute_callback)
             all_results.extend(results)
 
+            if results:
+                interval = min_interval
+            else:
+                interval = min(interval * 2, self.poll_interval)
+
         return all_results
 
     def has_pending_approvals(self) -> bool:
         """Check if there are any pending approvals"""
-        return len(self.pending_approvals) > 0
+        return len(self._dec_ids) > 0
 
     def get_pending_count(self) -> int:
         """Get count of pending approvals"""
-        return len(self.pending_approvals)
+        return len(self._dec_ids)
 
     def get_pending_decisions(self) -> List[PendingApproval]:
         """Get list of all pending approvals"""
-        return list(self.pending_approvals.values())
+        with self._pending_lock:
+            return [
+                PendingApproval(
+                    decision_id=self._dec_ids[i],
+                    action_name=self._action_names[i],
+                    action_args=self._action_args[i],
+                    requested_at=self._requested_at[i],
+                    callback_data=self._callback_data[i],
+                )
+                for i in range(len(self._dec_ids))
+            ]
@@ -0,0 +1,133 @@
+"""
+Approval Poller - one shared polling loop for many async agents
+
+Each AsyncAgent.poll_until_resolved runs its own wait loop, so N agents
+cost N timers and N SQLite round-trips per tick. ApprovalPoller lets
+cohabiting agents share a single loop: every tick gathers the pending
+decision IDs across all registered agents, issues one batched
+poll_decisions call, and dispatches the resolved statuses back to the
+owning agents.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ward.agent.async_agent import AsyncAgent
+from ward.storage import SQLiteAuditBackend
+
+
+class ApprovalPoller:
+    """
+    Shared approval poller for multiple AsyncAgents on one backend.
+
+    Usage:
+        poller = ApprovalPoller(backend)
+        poller.register(agent_a, execute_callback_a)
+        poller.register(agent_b, execute_callback_b)
+        poller.start()
+        ...
+        poller.stop()
+    """
+
+    def __init__(self, backend: SQLiteAuditBackend, poll_interval: float = 2.0):
+        self.backend = backend
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._agents: List[Tuple[AsyncAgent, Callable]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        agent: AsyncAgent,
+        execute_callback: Callable[[str, Dict[str, Any], str], Any],
+    ) -> None:
+        """
+        Register an agent; its pending approvals join the shared ticks.
+
+        Args:
+            agent: Agent whose queue should be polled
+            execute_callback: Called when one of its actions is approved
+        """
+        with self._lock:
+            self._agents.append((agent, execute_callback))
+
+    def unregister(self, agent: AsyncAgent) -> None:
+        """Remove an agent from the shared polling loop"""
+        with self._lock:
+            self._agents = [(a, cb) for a, cb in self._agents if a is not agent]
+
+    def poll_once(self) -> List[Dict[str, Any]]:
+        """
+        Run one shared tick: a single batched status query covering
+        every registered agent's pending decisions.
+
+        Returns:
+            All approvals resolved during this tick
+        """
+        with self._lock:
+            agents = list(self._agents)
+
+        # Gather every pending ID across agents; decision IDs are unique
+        # per decision, so ownership is unambiguous. Snapshots are taken
+        # under each agent's pending lock, so concurrent queueing on the
+        # owning threads can't hand us a half-appended row.
+        pending: List[Tuple[AsyncAgent, Callable, List[str]]] = []
+        all_ids = []
+        for agent, execute_callback in agents:
+            ids = agent.get_pending_ids()
+            if ids:
+                pending.append((agent, execute_callback, ids))
+                all_ids.extend(ids)
+
+        if not all_ids:
+            return []
+
+        statuses = self.backend.poll_decisions(all_ids)
+        if not statuses:
+            return []
+
+        results = []
+        for agent, execute_callback, ids in pending:
+            mine = {
+                dec_id: statuses[dec_id] for dec_id in ids if dec_id in statuses
+            }
+            if mine:
+                results.extend(agent._resolve_statuses(mine, execute_callback))
+
+        return results
+
+    def start(self) -> None:
+        """Start the background polling thread"""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="ward-approval-poller"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background polling thread"""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self.backend._notify_waiters()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Poll loop: wake on backend writes or poll_interval"""
+        while not self._stop.is_set():
+            self.backend.wait_for_update(timeout=self.poll_interval)
+            if self._stop.is_set():
+                break
+            self.poll_once()
+
+    def has_pending(self) -> bool:
+        """Check if any registered agent still has pending approvals"""
+        with self._lock:
+            return any(agent.has_pending_approvals() for agent, _ in self._agents)
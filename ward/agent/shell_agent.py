@@ -8,8 +8,11 @@ The agent:
 - Respects lease constraints (expiration, max_steps, revocation)
 """
 
+import functools
+import itertools
+import secrets
+import shlex
 import subprocess
-import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -28,6 +31,84 @@ from ward.intelligence import RulesBasedGenerator
 from ward.config import get_config
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_generator() -> RulesBasedGenerator:
+    """
+    Process-wide DIR generator shared across all agents.
+
+    RulesBasedGenerator.generate() holds no per-call state, so one
+    instance serves every agent in the process.
+    """
+    return RulesBasedGenerator()
+
+
+# Process-unique ID generation: a random prefix drawn once at import plus
+# a monotonic counter. Unlike uuid.uuid4(), minting an ID costs no
+# getrandom() syscall and no UUID object allocation.
+_ID_PREFIX = secrets.token_hex(8)
+_ID_COUNTER = itertools.count()
+
+
+def _new_id(kind: str) -> str:
+    """Generate a process-unique ID, e.g. 'act-9f3c2a1b8d4e5f60-1a'"""
+    return f"{kind}-{_ID_PREFIX}-{next(_ID_COUNTER):x}"
+
+
+# Characters that require a shell to interpret (pipes, redirects,
+# expansion, quoting). Commands without any of these run as a plain argv
+# without forking /bin/sh first.
+_SHELL_METACHARS = set(";|&><`$*?[](){}~#\\\"'\n")
+
+
+def _needs_shell(command: str) -> bool:
+    """Whether a command needs /bin/sh to run correctly"""
+    if any(c in _SHELL_METACHARS for c in command):
+        return True
+    # 'FOO=bar cmd' carries no metacharacter but the env-assignment
+    # prefix is a shell construct, not an executable name
+    first, _, _ = command.lstrip().partition(" ")
+    return "=" in first
+
+
+# Patterns that flag a command as potentially dangerous, compiled once
+# into a single alternation so each check is one regex pass
+_DANGEROUS_PATTERNS = [
+    r"\brm\s+(-rf?|--recursive)",  # rm -rf
+    r"\bsudo\b",  # sudo
+    r"\b(curl|wget)\b.*\|\s*bash",  # curl/wget | bash
+    r">\s*/dev/",  # Write to /dev
+    r"mkfs\b",  # Format filesystem
+    r"dd\b.*of=",  # dd with output
+]
+
+# Compiled over bytes: shell commands are overwhelmingly ASCII, and the
+# bytes engine skips per-codepoint Unicode case handling
+_DANGEROUS_RE = re.compile(
+    b"|".join(b"(?:%s)" % p.encode() for p in _DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+# Literal substrings that must be present for any dangerous pattern to
+# match. Checked first so safe commands (the common case) never invoke
+# the regex engine at all.
+_DANGEROUS_TRIGGERS = ("rm", "sudo", "curl", "wget", "mkfs", "dd", ">")
+
+# Optional DFA-based matcher (pip install ward[fast-match]). Hyperscan
+# scans all patterns in one linear pass over the input, which pays off
+# when screening large volumes of commands or captured output. Falls
+# back to the compiled alternation above when unavailable.
+try:
+    import hyperscan
+
+    _HYPERSCAN_DB = hyperscan.Database()
+    _HYPERSCAN_DB.compile(
+        expressions=[p.encode() for p in _DANGEROUS_PATTERNS],
+        ids=list(range(len(_DANGEROUS_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_DANGEROUS_PATTERNS),
+    )
+except Exception:  # ImportError, or patterns unsupported by this build
+    _HYPERSCAN_DB = None
+
+
 @dataclass
 class ExecutionResult:
     """Result of attempting to execute a command"""
@@ -54,6 +135,7 @@ class ShellAgent:
         backend: SQLiteAuditBackend,
         auto_request: bool = False,
         generate_dir: bool = True,
+        use_launcher: bool = False,
     ):
         """
         Initialize shell agent.
@@ -64,6 +146,8 @@ class ShellAgent:
             backend: Persistent audit backend
             auto_request: If True, automatically request authority (for demo)
             generate_dir: If True, generate Decision Intelligence Reports (v2)
+            use_launcher: If True, execute commands on persistent launcher
+                         workers instead of forking a process per command
         """
         self.agent_id = agent_id
         self.policy = policy
@@ -71,31 +155,42 @@ class ShellAgent:
         self.auto_request = auto_request
         self.active_leases: Dict[str, Lease] = {}
 
+        if use_launcher:
+            from ward.agent._launcher import _LauncherPool
+
+            self._launcher = _LauncherPool()
+        else:
+            self._launcher = None
+
         # Intelligence features (DIRs) respect global kill-switch
         config = get_config()
         self.generate_dir = generate_dir and config.intelligence_enabled
 
         if self.generate_dir:
-            self.dir_generator = RulesBasedGenerator()
+            self.dir_generator = _shared_generator()
         else:
             self.dir_generator = None
 
-    def _is_dangerous_command(self, command: str) -> bool:
+    @staticmethod
+    def _is_dangerous_command(command: str) -> bool:
         """Check if command is potentially dangerous"""
-        dangerous_patterns = [
-            r"\brm\s+(-rf?|--recursive)",  # rm -rf
-            r"\bsudo\b",  # sudo
-            r"\b(curl|wget)\b.*\|\s*bash",  # curl/wget | bash
-            r">\s*/dev/",  # Write to /dev
-            r"mkfs\b",  # Format filesystem
-            r"dd\b.*of=",  # dd with output
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True
+        # C-level substring scans; bail out before any regex work when
+        # none of the trigger literals appear
+        lowered = command.lower()
+        if not any(t in lowered for t in _DANGEROUS_TRIGGERS):
+            return False
+
+        command_b = command.encode("utf-8", "surrogatepass")
+
+        if _HYPERSCAN_DB is not None:
+            hits = []
+            _HYPERSCAN_DB.scan(
+                command_b,
+                match_event_handler=lambda *args: hits.append(True),
+            )
+            return bool(hits)
 
-        return False
+        return _DANGEROUS_RE.search(command_b) is not None
 
     def request_authority(
         self, command: str, context: Optional[Dict[str, Any]] = None
@@ -105,14 +200,18 @@ class ShellAgent:
 
         Returns a Decision (which may include a Lease if approved).
         """
-        context = context or {}
-        context["command"] = command
-        context["dangerous"] = self._is_dangerous_command(command)
+        # Build a fresh evaluation context rather than mutating the
+        # caller's dict in place
+        context = {
+            **(context or {}),
+            "command": command,
+            "dangerous": self._is_dangerous_command(command),
+        }
 
         # Evaluate against policy
         outcome, reason, rule = self.policy.evaluate("shell_exec", context)
 
-        decision_id = f"dec-{uuid.uuid4()}"
+        decision_id = _new_id("dec")
 
         if outcome == PolicyOutcome.ALLOW:
             # Create lease
@@ -260,7 +359,7 @@ class ShellAgent:
 
             # Record blocked action
             self.backend.record_action(
-                action_id=f"act-{uuid.uuid4()}",
+                action_id=_new_id("act"),
                 agent_id=self.agent_id,
                 action="shell_exec",
                 status="blocked",
@@ -279,30 +378,42 @@ class ShellAgent:
                 lease_id=lease_id,
             )
 
-        # Execute command
+        # Execute command. Commands with no shell metacharacters skip
+        # /bin/sh entirely: one fewer process, and subprocess can take
+        # CPython's posix_spawn fast path.
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            if self._launcher is not None:
+                # Persistent worker: fork+exec was paid once at startup
+                exit_code, stdout, stderr = self._launcher.run(command, timeout=30)
+            else:
+                needs_shell = _needs_shell(command)
+                result = subprocess.run(
+                    command if needs_shell else shlex.split(command),
+                    shell=needs_shell,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                exit_code, stdout, stderr = (
+                    result.returncode,
+                    result.stdout,
+                    result.stderr,
+                )
 
             # Record step
             lease.record_step()
 
             # Record action
             self.backend.record_action(
-                action_id=f"act-{uuid.uuid4()}",
+                action_id=_new_id("act"),
                 agent_id=self.agent_id,
                 action="shell_exec",
-                status="success" if result.returncode == 0 else "failed",
+                status="success" if exit_code == 0 else "failed",
                 lease_id=lease_id,
                 result={
-                    "exit_code": result.returncode,
-                    "stdout_length": len(result.stdout),
-                    "stderr_length": len(result.stderr),
+                    "exit_code": exit_code,
+                    "stdout_length": len(stdout),
+                    "stderr_length": len(stderr),
                 },
                 context={"command": command, "steps_taken": lease.steps_taken},
                 tags=["executed", "shell"],
@@ -310,16 +421,16 @@ class ShellAgent:
 
             return ExecutionResult(
                 allowed=True,
-                exit_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
                 reason="Executed successfully",
                 lease_id=lease_id,
             )
 
         except subprocess.TimeoutExpired:
             self.backend.record_action(
-                action_id=f"act-{uuid.uuid4()}",
+                action_id=_new_id("act"),
                 agent_id=self.agent_id,
                 action="shell_exec",
                 status="timeout",
@@ -340,7 +451,7 @@ class ShellAgent:
 
         except Exception as e:
             self.backend.record_action(
-                action_id=f"act-{uuid.uuid4()}",
+                action_id=_new_id("act"),
                 agent_id=self.agent_id,
                 action="shell_exec",
                 status="error",
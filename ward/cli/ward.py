@@ -16,35 +16,116 @@ Design: Deliberate, not convenient.
 """
 
 import argparse
-import json
-import sqlite3
+import functools
+import os
 import sys
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 import uuid
 
-from ward.storage import SQLiteAuditBackend
 from ward.config import get_config
-from ward.core import (
-    Lease,
-    Decision,
-    DecisionOutcome,
-    RevocationReason,
-    RevocationRecord,
-)
-from ward.policy import PolicyCompiler, PolicyCompilationError
+
+# Optional fast JSON serialization for --format=json output (same
+# optional extra the audit backend uses for parsing)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, default=str).encode("utf-8")
+
+# Shared literals for the approve/deny recording paths. Tuples rather
+# than inline list literals so batch loops don't allocate a fresh list
+# per decision
+_AGENT_CLI = "human:cli"
+_ACT_APPROVE = "approve_decision"
+_ACT_DENY = "deny_decision"
+_APPROVE_TAGS_SINGLE = ("approval", "human")
+_APPROVE_TAGS_BATCH = ("approval", "human", "batch")
+_DENY_TAGS_SINGLE = ("denial", "human")
+_DENY_TAGS_BATCH = ("denial", "human", "batch")
+
+
+def _make_uuids(n: int) -> List[str]:
+    """
+    Draw n random UUID4 strings from a single urandom read.
+
+    uuid.uuid4() reads /dev/urandom once per call; batch paths that
+    need several IDs per decision pull all the entropy in one syscall
+    and slice it. uuid.UUID(version=4) sets the version/variant bits,
+    so the results are ordinary UUID4s.
+    """
+    buf = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=buf[i : i + 16], version=4))
+        for i in range(0, 16 * n, 16)
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _policy_compiler():
+    """
+    Import the policy compiler on first use.
+
+    ward.policy drags in the YAML stack, which only the policy-*
+    subcommands need; deferring it keeps `ward status` and friends off
+    that import path.
+    """
+    from ward.policy import PolicyCompiler, PolicyCompilationError
+
+    return PolicyCompiler, PolicyCompilationError
 
 
 class WardCLI:
     """Ward command-line interface"""
 
     def __init__(self, db_path: str = "ward.db"):
-        self.backend = SQLiteAuditBackend(db_path)
         self.db_path = db_path
+        self._backend = None
+        # Config is resolved once per CLI process; re-calling get_config()
+        # per command (or per decision in loops) re-reads nothing new
+        self.config = get_config()
+
+    @property
+    def backend(self):
+        """
+        Audit backend, opened on first use.
+
+        Lazy so policy-* subcommands never import ward.storage/sqlite3
+        or create the database file.
+        """
+        if self._backend is None:
+            from ward.storage import SQLiteAuditBackend
+
+            self._backend = SQLiteAuditBackend(self.db_path)
+        return self._backend
 
     def cmd_approvals(self, args):
         """List pending approvals"""
-        pending = self.backend.get_pending_approvals()
+        pending = self.backend.get_pending_approvals(limit=args.limit)
+
+        # DIR lookups are opt-in: piped/CI consumers can fetch intel
+        # separately, so don't pay for it unless asked
+        intel_map = {}
+        if args.include_intel and self.config.intelligence_enabled:
+            intel_map = self.backend.get_decision_intel_many(
+                [d["id"] for d in pending]
+            )
+
+        if args.format == "json":
+            # One batched serialization straight to the byte stream; no
+            # per-field formatting for machine consumers
+            if intel_map:
+                for dec in pending:
+                    dir_data = intel_map.get(dec["id"])
+                    dec["intel"] = dir_data["payload"] if dir_data else None
+            sys.stdout.buffer.write(_dumps(pending) + b"\n")
+            return
 
         if not pending:
             print("No pending approvals.")
@@ -54,40 +135,43 @@ class WardCLI:
 
         for dec in pending:
             # Try to get DIR for risk level (if intelligence enabled)
-            config = get_config()
             risk_level = ""
-            if config.intelligence_enabled:
-                dir_data = self.backend.get_decision_intel(dec["id"])
+            if intel_map:
+                dir_data = intel_map.get(dec["id"])
                 if dir_data:
                     payload = dir_data["payload"]
                     risk = payload.get("risk_assessment", {}).get("risk_level", "")
                     if risk:
                         risk_level = f"  Risk: {risk.upper()}"
 
-            print(f"ID: {dec['id']}{risk_level}")
-            print(f"Agent: {dec['agent_id']}")
-            print(f"Action: {dec['action']}")
+            # One buffered write per record instead of a print (and
+            # potential flush on a line-buffered TTY) per field
+            out = [
+                f"ID: {dec['id']}{risk_level}\n",
+                f"Agent: {dec['agent_id']}\n",
+                f"Action: {dec['action']}\n",
+            ]
 
             # Show command if it's a shell execution
             if dec.get("context") and "command" in dec["context"]:
-                print(f"Command: {dec['context']['command']}")
+                out.append(f"Command: {dec['context']['command']}\n")
 
-            print(f"Requested at: {dec['timestamp']}")
+            out.append(f"Requested at: {dec['timestamp']}\n")
 
             if dec.get("known_unknowns"):
-                print("\nKnown unknowns:")
+                out.append("\nKnown unknowns:\n")
                 for unknown in dec["known_unknowns"]:
-                    print(f"- {unknown}")
+                    out.append(f"- {unknown}\n")
 
-            print()
+            out.append("\n")
+            sys.stdout.write("".join(out))
 
     def cmd_inspect(self, args):
         """Inspect a specific decision"""
         decision_id = args.decision_id
 
-        # Query decision
-        decisions = self.backend.get_decisions()
-        decision = next((d for d in decisions if d["id"] == decision_id), None)
+        # Query decision with one indexed lookup
+        decision = self.backend.get_decision(decision_id)
 
         if not decision:
             print(f"Error: Decision {decision_id} not found")
@@ -99,8 +183,7 @@ class WardCLI:
 
         # Try to get DIR
         # Show DIR if intelligence is enabled
-        config = get_config()
-        if config.intelligence_enabled:
+        if self.config.intelligence_enabled:
             dir_data = self.backend.get_decision_intel(decision_id)
             if dir_data:
                 self._print_dir(dir_data["payload"])
@@ -122,52 +205,64 @@ class WardCLI:
 
     def _print_dir(self, payload: dict):
         """Print DIR in readable format"""
-        print()
+        # Build the whole report in a list and write it once: ~20 print
+        # calls per DIR become a single stdout write
+        parts = ["\n"]
+        append = parts.append
+
+        # Destructure the payload once up front; every field is read a
+        # single time instead of re-hashing the same keys per branch
+        risk = payload.get("risk_assessment") or {}
+        risk_factors = risk.get("risk_factors") or ()
+        blast = risk.get("blast_radius") or {}
+        rev = risk.get("reversibility") or {}
+        missing = payload.get("missing_info") or ()
+        constraints = payload.get("recommended_constraints")
 
         # Risk assessment
-        risk = payload.get("risk_assessment", {})
         if risk:
             risk_level = risk.get("risk_level", "unknown").upper()
-            print(f"Risk: {risk_level}")
+            append(f"Risk: {risk_level}\n")
 
             # Risk factors
-            risk_factors = risk.get("risk_factors", [])
-            if risk_factors:
-                for rf in risk_factors:
-                    print(f"  - {rf['code']} ({rf['severity']})")
-                    print(f"    {rf['explanation']}")
+            append(
+                "".join(
+                    f"  - {rf['code']} ({rf['severity']})\n    {rf['explanation']}\n"
+                    for rf in risk_factors
+                )
+            )
 
             # Blast radius
-            blast = risk.get("blast_radius", {})
             if blast:
-                print(f"\nBlast radius: {blast['scope']} (confidence: {blast['confidence']})")
-                print(f"  {blast['estimate']}")
+                append(f"\nBlast radius: {blast['scope']} (confidence: {blast['confidence']})\n")
+                append(f"  {blast['estimate']}\n")
 
             # Reversibility
-            rev = risk.get("reversibility", {})
             if rev:
-                print(f"\nReversibility: {rev['estimate']}")
+                append(f"\nReversibility: {rev['estimate']}\n")
                 if rev.get('notes'):
-                    print(f"  {rev['notes']}")
+                    append(f"  {rev['notes']}\n")
 
         # Missing info
-        missing = payload.get("missing_info", [])
         if missing:
-            print(f"\nMissing info:")
-            for mi in missing:
-                blocking = " (blocking)" if mi.get("blocking") else ""
-                print(f"  - {mi['field']}{blocking}: {mi['question']}")
+            append("\nMissing info:\n")
+            append(
+                "".join(
+                    f"  - {mi['field']}{' (blocking)' if mi.get('blocking') else ''}: {mi['question']}\n"
+                    for mi in missing
+                )
+            )
 
         # Recommended constraints
-        constraints = payload.get("recommended_constraints")
-        if constraints:
-            print(f"\nRecommended constraints if approved:")
-            print(f"  - ttl: {constraints['ttl_seconds']}s ({constraints['ttl_seconds']//60}m)")
-            print(f"  - max_steps: {constraints['max_steps']}")
+        if constraints is not None:
+            append("\nRecommended constraints if approved:\n")
+            append(f"  - ttl: {constraints['ttl_seconds']}s ({constraints['ttl_seconds']//60}m)\n")
+            append(f"  - max_steps: {constraints['max_steps']}\n")
             if constraints.get("forbidden_patterns"):
-                print(f"  - forbid patterns: {', '.join(constraints['forbidden_patterns'])}")
+                append(f"  - forbid patterns: {', '.join(constraints['forbidden_patterns'])}\n")
 
-        print()
+        append("\n")
+        sys.stdout.write("".join(parts))
 
     def cmd_approve(self, args):
         """Approve a decision with explicit confirmation"""
@@ -182,9 +277,8 @@ class WardCLI:
             print("Error: decision_id is required unless using --all")
             return 1
 
-        # Query decision
-        decisions = self.backend.get_pending_approvals()
-        decision = next((d for d in decisions if d["id"] == decision_id), None)
+        # Query decision with one indexed lookup
+        decision = self.backend.get_pending_decision(decision_id)
 
         if not decision:
             print(f"Error: Pending decision {decision_id} not found")
@@ -202,12 +296,11 @@ class WardCLI:
                 print(f"  {decision['context']['command']}")
 
         # Check for Decision Intelligence recommendations (if intelligence enabled)
-        config = get_config()
         recommended_steps = 1
         recommended_duration = 5
         missing_info_questions = []
 
-        if config.intelligence_enabled:
+        if self.config.intelligence_enabled:
             dir_data = self.backend.get_decision_intel(decision_id)
         else:
             dir_data = None
@@ -263,8 +356,8 @@ class WardCLI:
         # Record approval action
         self.backend.record_action(
             action_id=f"approval-{uuid.uuid4()}",
-            agent_id="human:cli",
-            action="approve_decision",
+            agent_id=_AGENT_CLI,
+            action=_ACT_APPROVE,
             status="approved",
             result={
                 "decision_id": decision_id,
@@ -273,7 +366,7 @@ class WardCLI:
                 "expires_at": expires_at.isoformat(),
             },
             context={"decision": decision},
-            tags=["approval", "human"],
+            tags=_APPROVE_TAGS_SINGLE,
         )
 
         # Record human approval for saturation tracking (v2.5)
@@ -299,7 +392,7 @@ class WardCLI:
 
     def _approve_all(self, args):
         """Approve all pending decisions"""
-        pending = self.backend.get_pending_approvals()
+        pending = self.backend.get_pending_approvals(limit=args.limit)
 
         if not pending:
             print("No pending approvals.")
@@ -313,8 +406,6 @@ class WardCLI:
                 print(f"   Command: {dec['context']['command']}")
             print()
 
-        # Get config for recommended constraints
-        config = get_config()
         max_steps = args.max_steps or 1
         duration_minutes = args.duration or 5
 
@@ -330,56 +421,66 @@ class WardCLI:
             print("\n✗ Batch approval cancelled")
             return 1
 
-        # Approve each decision
+        # Build the whole batch in one pass, then write it under a
+        # single transaction instead of 3 commits per decision
         print(f"\n✅ Approving {len(pending)} decisions...")
-        approved_count = 0
+
+        decision_updates = []
+        actions = []
+        approvals = []
+        lease_ids = []
+
+        # Every lease in the batch shares the same expiry baseline;
+        # no need to re-read the clock per decision
+        expires_at = datetime.now() + timedelta(minutes=duration_minutes)
+        expires_at_iso = expires_at.isoformat()
+
+        # Three IDs per decision, drawn with one urandom read
+        ids = iter(_make_uuids(3 * len(pending)))
 
         for decision in pending:
             decision_id = decision["id"]
-            lease_id = str(uuid.uuid4())
-            expires_at = datetime.now() + timedelta(minutes=duration_minutes)
-
-            # Update decision with lease
-            self.backend.update_decision(
-                decision_id=decision_id,
-                outcome="approved",
-                lease_id=lease_id,
+            lease_id = next(ids)
+            lease_ids.append(lease_id)
+
+            decision_updates.append(("approved", lease_id, decision_id))
+            actions.append(
+                dict(
+                    action_id=f"approval-{next(ids)}",
+                    agent_id=_AGENT_CLI,
+                    action=_ACT_APPROVE,
+                    status="approved",
+                    result={
+                        "decision_id": decision_id,
+                        "lease_id": lease_id,
+                        "max_steps": max_steps,
+                        "expires_at": expires_at_iso,
+                    },
+                    context={"decision": decision},
+                    tags=_APPROVE_TAGS_BATCH,
+                )
             )
-
-            # Record approval action
-            self.backend.record_action(
-                action_id=f"approval-{uuid.uuid4()}",
-                agent_id="human:cli",
-                action="approve_decision",
-                status="approved",
-                result={
-                    "decision_id": decision_id,
-                    "lease_id": lease_id,
-                    "max_steps": max_steps,
-                    "expires_at": expires_at.isoformat(),
-                },
-                context={"decision": decision},
-                tags=["approval", "human", "batch"],
+            approvals.append(
+                dict(
+                    approval_id=f"human-{next(ids)}",
+                    decision_id=decision_id,
+                    human_outcome="approved",
+                    recommended_max_steps=1,
+                    actual_max_steps=max_steps,
+                    recommended_duration_minutes=5,
+                    actual_duration_minutes=duration_minutes,
+                    missing_info_questions=[],
+                    missing_info_resolved=[],
+                    rationale=args.comment or "Batch approval",
+                )
             )
 
-            # Record human approval for saturation tracking
-            self.backend.record_human_approval(
-                approval_id=f"human-{uuid.uuid4()}",
-                decision_id=decision_id,
-                human_outcome="approved",
-                recommended_max_steps=1,
-                actual_max_steps=max_steps,
-                recommended_duration_minutes=5,
-                actual_duration_minutes=duration_minutes,
-                missing_info_questions=[],
-                missing_info_resolved=[],
-                rationale=args.comment or "Batch approval",
-            )
+        self.backend.apply_human_decisions(decision_updates, actions, approvals)
 
-            approved_count += 1
+        for decision, lease_id in zip(pending, lease_ids):
             print(f"  ✓ Approved {decision['action'][:50]}... (lease: {lease_id[:8]}...)")
 
-        print(f"\n✓ Successfully approved {approved_count} decision(s)")
+        print(f"\n✓ Successfully approved {len(pending)} decision(s)")
         if args.comment:
             print(f"Rationale: {args.comment}")
 
@@ -400,9 +501,8 @@ class WardCLI:
 
         comment = args.comment or "Denied by human operator"
 
-        # Query decision
-        decisions = self.backend.get_pending_approvals()
-        decision = next((d for d in decisions if d["id"] == decision_id), None)
+        # Query decision with one indexed lookup
+        decision = self.backend.get_pending_decision(decision_id)
 
         if not decision:
             print(f"Error: Pending decision {decision_id} not found")
@@ -425,12 +525,12 @@ class WardCLI:
         # Record denial
         self.backend.record_action(
             action_id=f"denial-{uuid.uuid4()}",
-            agent_id="human:cli",
-            action="deny_decision",
+            agent_id=_AGENT_CLI,
+            action=_ACT_DENY,
             status="denied",
             result={"decision_id": decision_id, "reason": comment},
             context={"decision": decision},
-            tags=["denial", "human"],
+            tags=_DENY_TAGS_SINGLE,
         )
 
         # Record human denial for saturation tracking (v2.5)
@@ -451,7 +551,7 @@ class WardCLI:
 
     def _deny_all(self, args):
         """Deny all pending decisions"""
-        pending = self.backend.get_pending_approvals()
+        pending = self.backend.get_pending_approvals(limit=args.limit)
 
         if not pending:
             print("No pending approvals.")
@@ -473,53 +573,63 @@ class WardCLI:
             print("\n✗ Batch denial cancelled")
             return 1
 
-        # Deny each decision
+        # Build the whole batch in one pass, then write it under a
+        # single transaction instead of 3 commits per decision
         print(f"\n🚫 Denying {len(pending)} decisions...")
-        denied_count = 0
         comment = args.comment or "Batch denial by human operator"
 
+        # Batched DIR fetch for the whole denial set
+        intel_map = self.backend.get_decision_intel_many(
+            [d["id"] for d in pending]
+        )
+
+        decision_updates = []
+        actions = []
+        approvals = []
+
+        # Two IDs per decision, drawn with one urandom read
+        ids = iter(_make_uuids(2 * len(pending)))
+
         for decision in pending:
             decision_id = decision["id"]
 
             # Get DIR data for saturation tracking
-            dir_data = self.backend.get_decision_intel(decision_id)
+            dir_data = intel_map.get(decision_id)
             missing_info_questions = []
             if dir_data:
                 payload = dir_data["payload"]
                 missing_info = payload.get("missing_info", [])
                 missing_info_questions = [mi.get("field", "") for mi in missing_info]
 
-            # Update decision to denied
-            self.backend.update_decision(
-                decision_id=decision_id,
-                outcome="denied",
+            decision_updates.append(("denied", None, decision_id))
+            actions.append(
+                dict(
+                    action_id=f"denial-{next(ids)}",
+                    agent_id=_AGENT_CLI,
+                    action=_ACT_DENY,
+                    status="denied",
+                    result={"decision_id": decision_id, "reason": comment},
+                    context={"decision": decision},
+                    tags=_DENY_TAGS_BATCH,
+                )
             )
-
-            # Record denial
-            self.backend.record_action(
-                action_id=f"denial-{uuid.uuid4()}",
-                agent_id="human:cli",
-                action="deny_decision",
-                status="denied",
-                result={"decision_id": decision_id, "reason": comment},
-                context={"decision": decision},
-                tags=["denial", "human", "batch"],
+            approvals.append(
+                dict(
+                    approval_id=f"human-{next(ids)}",
+                    decision_id=decision_id,
+                    human_outcome="denied",
+                    missing_info_questions=missing_info_questions,
+                    missing_info_resolved=[],
+                    rationale=comment,
+                )
             )
 
-            # Record human denial for saturation tracking
-            self.backend.record_human_approval(
-                approval_id=f"human-{uuid.uuid4()}",
-                decision_id=decision_id,
-                human_outcome="denied",
-                missing_info_questions=missing_info_questions,
-                missing_info_resolved=[],
-                rationale=comment,
-            )
+        self.backend.apply_human_decisions(decision_updates, actions, approvals)
 
-            denied_count += 1
+        for decision in pending:
             print(f"  ✓ Denied {decision['action'][:50]}...")
 
-        print(f"\n✓ Successfully denied {denied_count} decision(s)")
+        print(f"\n✓ Successfully denied {len(pending)} decision(s)")
         if args.comment:
             print(f"Rationale: {args.comment}")
 
@@ -536,7 +646,7 @@ class WardCLI:
             lease_id=lease_id,
             agent_id="unknown",  # Would need to look up from lease
             reason="human_override",
-            revoked_by="human:cli",
+            revoked_by=_AGENT_CLI,
             description=comment,
         )
 
@@ -550,6 +660,8 @@ class WardCLI:
         """Validate YAML policy without compiling"""
         policy_file = args.policy_file
 
+        PolicyCompiler, PolicyCompilationError = _policy_compiler()
+
         try:
             compiler = PolicyCompiler()
             policy = compiler.compile(policy_file)
@@ -567,6 +679,8 @@ class WardCLI:
         """Show compiled policy rules"""
         policy_file = args.policy_file
 
+        PolicyCompiler, PolicyCompilationError = _policy_compiler()
+
         try:
             compiler = PolicyCompiler()
             policy = compiler.compile(policy_file)
@@ -601,6 +715,8 @@ class WardCLI:
         policy_file = args.policy_file
         rule_id = args.rule_id
 
+        PolicyCompiler, PolicyCompilationError = _policy_compiler()
+
         try:
             compiler = PolicyCompiler()
             policy = compiler.compile(policy_file)
@@ -626,30 +742,41 @@ class WardCLI:
         """Show Ward system status overview"""
         from datetime import datetime, timedelta
 
-        # Get pending approvals
-        pending = self.backend.get_pending_approvals()
+        # Count pending approvals SQL-side rather than fetching rows
+        pending_count = self.backend.count_pending_approvals()
 
-        # Get recent revocations (last 24h)
-        all_revocations = self.backend.get_revocations()
+        # Get recent revocations (last 24h), filtered SQL-side instead
+        # of parsing every revocation timestamp in Python
         now = datetime.now()
-        recent_revocations = [
-            r
-            for r in all_revocations
-            if (now - datetime.fromisoformat(r["timestamp"])) < timedelta(hours=24)
-        ]
-
-        # Get total decisions
-        all_decisions = self.backend.get_decisions()
+        recent_revocations = self.backend.get_revocations_since(
+            (now - timedelta(hours=24)).isoformat()
+        )
 
-        # Count active leases (approved decisions with leases)
-        active_leases = sum(1 for d in all_decisions if d.get("lease_id") and d["outcome"] == "approved")
+        # Counts come straight from SQL aggregates; no need to
+        # materialize the decision rows just to count them
+        active_leases = self.backend.count_active_leases()
+        total_decisions = self.backend.count_decisions()
+
+        if args.format == "json":
+            sys.stdout.buffer.write(
+                _dumps(
+                    {
+                        "active_leases": active_leases,
+                        "pending_approvals": pending_count,
+                        "revocations_24h": len(recent_revocations),
+                        "total_decisions": total_decisions,
+                    }
+                )
+                + b"\n"
+            )
+            return
 
         print("\nWard Status")
         print("=" * 60)
         print(f"Active leases: {active_leases}")
-        print(f"Pending approvals: {len(pending)}")
+        print(f"Pending approvals: {pending_count}")
         print(f"Revocations (last 24h): {len(recent_revocations)}")
-        print(f"Total decisions: {len(all_decisions)}")
+        print(f"Total decisions: {total_decisions}")
         print("=" * 60 + "\n")
 
     def cmd_saturation(self, args):
@@ -684,94 +811,54 @@ class WardCLI:
 
     def cmd_leases(self, args) -> int:
         """Show active leases"""
+        # One SQL query does the revocation anti-join, expiry filter,
+        # and constraint extraction that used to be three queries plus
+        # a Python-side JSON parse per approval action
+        now = datetime.now()
+        leases = self.backend.list_active_leases(now.isoformat())
+
+        if args.format == "json":
+            sys.stdout.buffer.write(_dumps(leases) + b"\n")
+            return 0
+
         print("\nActive Leases")
         print("=" * 80)
 
-        # Get approved decisions with lease_ids
-        decisions = self.backend.get_decisions(outcome="approved", limit=1000)
-
-        if not decisions:
+        if not leases:
             print("No active leases found.\n")
             return 0
 
-        # Get revocations to filter out revoked leases
-        conn = sqlite3.connect(self.backend.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("SELECT lease_id FROM revocations")
-        revoked_lease_ids = {row["lease_id"] for row in cursor.fetchall()}
-
-        # Get approval actions to find lease details (max_steps, expires_at)
-        cursor.execute("""
-            SELECT result FROM actions
-            WHERE action = 'approve_decision'
-            AND status = 'approved'
-        """)
-        approval_actions = cursor.fetchall()
-        conn.close()
-
-        # Build lease_id -> details map
-        lease_details = {}
-        for action in approval_actions:
-            result = json.loads(action["result"])
-            lease_id = result.get("lease_id")
-            if lease_id:
-                lease_details[lease_id] = {
-                    "max_steps": result.get("max_steps", 1),
-                    "expires_at": result.get("expires_at", "unknown"),
-                    "decision_id": result.get("decision_id", "unknown"),
-                }
-
-        # Filter and display active leases
-        active_count = 0
-        now = datetime.now()
-
-        for decision in decisions:
-            lease_id = decision["lease_id"]
-
-            # Skip if revoked
-            if lease_id in revoked_lease_ids:
-                continue
-
-            # Get lease details
-            details = lease_details.get(lease_id, {})
-            expires_at_str = details.get("expires_at", "unknown")
-
-            # Check if expired
-            if expires_at_str != "unknown":
-                try:
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    if now > expires_at:
-                        continue  # Skip expired leases
-                except ValueError:
-                    pass  # If we can't parse, show it anyway
-
-            # This lease is active
-            active_count += 1
+        for lease in leases:
+            expires_at_str = lease["expires_at"] or "unknown"
 
-            print(f"\nLease ID: {lease_id}")
-            print(f"Agent: {decision['agent_id']}")
-            print(f"Action: {decision['action']}")
-            print(f"Decision ID: {decision['id']}")
-            print(f"Max steps: {details.get('max_steps', 'unknown')}")
-            print(f"Expires at: {expires_at_str}")
+            # One buffered write per lease instead of a print per field
+            out = [
+                f"\nLease ID: {lease['lease_id']}\n",
+                f"Agent: {lease['agent_id']}\n",
+                f"Action: {lease['action']}\n",
+                f"Decision ID: {lease['decision_id']}\n",
+                f"Max steps: {lease['max_steps'] if lease['max_steps'] is not None else 'unknown'}\n",
+                f"Expires at: {expires_at_str}\n",
+            ]
 
             if expires_at_str != "unknown":
                 try:
                     expires_at = datetime.fromisoformat(expires_at_str)
                     time_left = expires_at - now
                     minutes_left = int(time_left.total_seconds() / 60)
-                    print(f"Time remaining: {minutes_left} minutes")
+                    out.append(f"Time remaining: {minutes_left} minutes\n")
                 except ValueError:
                     pass
 
+            sys.stdout.write("".join(out))
+
         print("\n" + "=" * 80)
-        print(f"Total active leases: {active_count}\n")
+        print(f"Total active leases: {len(leases)}\n")
         return 0
 
     def cmd_config(self, args) -> int:
         """Show Ward configuration and feature flags"""
-        config = get_config()
+        config = self.config
 
         print("\nWard Configuration")
         print("=" * 80)
@@ -808,36 +895,40 @@ class WardCLI:
         return 0
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        prog="ward",
-        description="Ward - Human approval interface for AI agent control",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+def _add_format_arg(p) -> None:
+    # Human-readable on a TTY, machine-readable JSON when piped
+    p.add_argument(
+        "--format",
+        choices=("human", "json"),
+        default="human" if sys.stdout.isatty() else "json",
+        help="Output format (default: human on a TTY, json when piped)",
     )
 
-    parser.add_argument(
-        "--db",
-        default="ward.db",
-        help="Path to Ward database (default: ward.db)",
-    )
 
-    parser.add_argument(
-        "--no-intelligence",
+def _build_approvals(subparsers) -> None:
+    approvals_parser = subparsers.add_parser(
+        "approvals", help="List pending approvals"
+    )
+    approvals_parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum pending approvals to list (default: 100)",
+    )
+    approvals_parser.add_argument(
+        "--include-intel",
         action="store_true",
-        help="Disable intelligence features (DIRs, LLM). Proves deterministic fallback works.",
+        help="Fetch Decision Intelligence Reports for each approval",
     )
+    _add_format_arg(approvals_parser)
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # ward approvals
-    subparsers.add_parser("approvals", help="List pending approvals")
 
-    # ward inspect <decision_id>
+def _build_inspect(subparsers) -> None:
     inspect_parser = subparsers.add_parser("inspect", help="Inspect a decision")
     inspect_parser.add_argument("decision_id", help="Decision ID to inspect")
 
-    # ward approve <decision_id>
+
+def _build_approve(subparsers) -> None:
     approve_parser = subparsers.add_parser(
         "approve", help="Approve a decision (requires confirmation)"
     )
@@ -857,13 +948,20 @@ def main():
         type=int,
         help="Lease duration in minutes (default: 5)",
     )
+    approve_parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum decisions to approve with --all (default: 100)",
+    )
     approve_parser.add_argument(
         "-m",
         "--comment",
         help="Explain why you approved this decision",
     )
 
-    # ward deny <decision_id>
+
+def _build_deny(subparsers) -> None:
     deny_parser = subparsers.add_parser("deny", help="Deny a decision")
     deny_parser.add_argument("decision_id", nargs="?", help="Decision ID to deny (not needed with --all)")
     deny_parser.add_argument(
@@ -871,13 +969,20 @@ def main():
         action="store_true",
         help="Deny all pending decisions",
     )
+    deny_parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum decisions to deny with --all (default: 100)",
+    )
     deny_parser.add_argument(
         "-m",
         "--comment",
         help="Explain why you denied this decision",
     )
 
-    # ward revoke <lease_id>
+
+def _build_revoke(subparsers) -> None:
     revoke_parser = subparsers.add_parser("revoke", help="Revoke an active lease")
     revoke_parser.add_argument("lease_id", help="Lease ID to revoke")
     revoke_parser.add_argument(
@@ -886,37 +991,132 @@ def main():
         help="Explain why you revoked this lease",
     )
 
-    # ward policy-validate <policy_file>
+
+def _build_policy_validate(subparsers) -> None:
     policy_validate_parser = subparsers.add_parser(
         "policy-validate", help="Validate YAML policy"
     )
     policy_validate_parser.add_argument("policy_file", help="Path to YAML policy file")
 
-    # ward policy-compile <policy_file>
+
+def _build_policy_compile(subparsers) -> None:
     policy_compile_parser = subparsers.add_parser(
         "policy-compile", help="Show compiled policy rules"
     )
     policy_compile_parser.add_argument("policy_file", help="Path to YAML policy file")
 
-    # ward policy-explain <policy_file> <rule_id>
+
+def _build_policy_explain(subparsers) -> None:
     policy_explain_parser = subparsers.add_parser(
         "policy-explain", help="Explain a specific policy rule"
     )
     policy_explain_parser.add_argument("policy_file", help="Path to YAML policy file")
     policy_explain_parser.add_argument("rule_id", help="Rule ID to explain")
 
-    # ward status
-    subparsers.add_parser("status", help="Show Ward system status overview")
 
-    # ward saturation
+def _build_status(subparsers) -> None:
+    status_parser = subparsers.add_parser(
+        "status", help="Show Ward system status overview"
+    )
+    _add_format_arg(status_parser)
+
+
+def _build_saturation(subparsers) -> None:
     subparsers.add_parser("saturation", help="Show decision saturation metrics (LLM readiness)")
 
-    # ward leases
-    subparsers.add_parser("leases", help="List active leases")
 
-    # ward config
+def _build_leases(subparsers) -> None:
+    leases_parser = subparsers.add_parser("leases", help="List active leases")
+    _add_format_arg(leases_parser)
+
+
+def _build_config(subparsers) -> None:
     subparsers.add_parser("config", help="Show configuration and feature flags")
 
+
+# Command registry: name -> thunk that materializes its subparser. The
+# common invocation names one subcommand, so only that builder runs;
+# help/unknown-command paths build them all
+_COMMAND_BUILDERS = {
+    "approvals": _build_approvals,
+    "inspect": _build_inspect,
+    "approve": _build_approve,
+    "deny": _build_deny,
+    "revoke": _build_revoke,
+    "policy-validate": _build_policy_validate,
+    "policy-compile": _build_policy_compile,
+    "policy-explain": _build_policy_explain,
+    "status": _build_status,
+    "saturation": _build_saturation,
+    "leases": _build_leases,
+    "config": _build_config,
+}
+
+
+# Command dispatch: argparse has already validated args.command, so
+# main() resolves the handler with one dict hit instead of a compare
+# chain
+_DISPATCH = {
+    "approvals": WardCLI.cmd_approvals,
+    "inspect": WardCLI.cmd_inspect,
+    "approve": WardCLI.cmd_approve,
+    "deny": WardCLI.cmd_deny,
+    "revoke": WardCLI.cmd_revoke,
+    "policy-validate": WardCLI.cmd_policy_validate,
+    "policy-compile": WardCLI.cmd_policy_compile,
+    "policy-explain": WardCLI.cmd_policy_explain,
+    "status": WardCLI.cmd_status,
+    "saturation": WardCLI.cmd_saturation,
+    "leases": WardCLI.cmd_leases,
+    "config": WardCLI.cmd_config,
+}
+
+
+def _register_subcommands(subparsers, only: Optional[str] = None) -> None:
+    """
+    Register subcommand parsers.
+
+    With `only`, registers just that command — building the other
+    eleven parsers is pure startup cost for a sub-second CLI. Without
+    it (help, unknown command, global flags first), the full parser is
+    built.
+    """
+    if only is not None:
+        _COMMAND_BUILDERS[only](subparsers)
+        return
+    for build in _COMMAND_BUILDERS.values():
+        build(subparsers)
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(
+        prog="ward",
+        description="Ward - Human approval interface for AI agent control",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--db",
+        default="ward.db",
+        help="Path to Ward database (default: ward.db)",
+    )
+
+    parser.add_argument(
+        "--no-intelligence",
+        action="store_true",
+        help="Disable intelligence features (DIRs, LLM). Proves deterministic fallback works.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Fast path: when argv[1] names a subcommand, skip building the
+    # other eleven parsers
+    invoked = sys.argv[1] if len(sys.argv) > 1 else None
+    _register_subcommands(
+        subparsers, only=invoked if invoked in _COMMAND_BUILDERS else None
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -934,33 +1134,11 @@ def main():
     cli = WardCLI(db_path=args.db)
 
     # Dispatch command
-    if args.command == "approvals":
-        return cli.cmd_approvals(args) or 0
-    elif args.command == "inspect":
-        return cli.cmd_inspect(args) or 0
-    elif args.command == "approve":
-        return cli.cmd_approve(args) or 0
-    elif args.command == "deny":
-        return cli.cmd_deny(args) or 0
-    elif args.command == "revoke":
-        return cli.cmd_revoke(args) or 0
-    elif args.command == "policy-validate":
-        return cli.cmd_policy_validate(args) or 0
-    elif args.command == "policy-compile":
-        return cli.cmd_policy_compile(args) or 0
-    elif args.command == "policy-explain":
-        return cli.cmd_policy_explain(args) or 0
-    elif args.command == "status":
-        return cli.cmd_status(args) or 0
-    elif args.command == "saturation":
-        return cli.cmd_saturation(args) or 0
-    elif args.command == "leases":
-        return cli.cmd_leases(args) or 0
-    elif args.command == "config":
-        return cli.cmd_config(args) or 0
-    else:
+    handler = _DISPATCH.get(args.command)
+    if handler is None:
         print(f"Unknown command: {args.command}")
         return 1
+    return handler(cli, args) or 0
 
 
 if __name__ == "__main__":
@@ -20,19 +20,17 @@ class WardConfig:
     """
 
     def __init__(self):
+        # Environment values don't change mid-process, so they are
+        # parsed once and shared by every WardConfig construction
+        intelligence, verbose = _read_env()
+
         # LLM Kill-Switch (Requirement #9)
         # Default: OFF
         # Set WARD_ENABLE_INTELLIGENCE=1 to enable
-        self._intelligence_enabled = self._parse_bool_env(
-            "WARD_ENABLE_INTELLIGENCE",
-            default=False
-        )
+        self._intelligence_enabled = intelligence
 
         # Verbose logging for debugging
-        self._verbose = self._parse_bool_env(
-            "WARD_VERBOSE",
-            default=False
-        )
+        self._verbose = verbose
 
     @property
     def intelligence_enabled(self) -> bool:
@@ -95,6 +93,21 @@ class WardConfig:
         return value.lower() in ("1", "true", "yes", "on")
 
 
+# Parsed environment values, shared across WardConfig instances
+_env_cache: Optional[tuple] = None
+
+
+def _read_env() -> tuple:
+    """Parse feature-flag environment variables once per process"""
+    global _env_cache
+    if _env_cache is None:
+        _env_cache = (
+            WardConfig._parse_bool_env("WARD_ENABLE_INTELLIGENCE", default=False),
+            WardConfig._parse_bool_env("WARD_VERBOSE", default=False),
+        )
+    return _env_cache
+
+
 # Global config instance
 _global_config: Optional[WardConfig] = None
 
@@ -108,6 +121,7 @@ def get_config() -> WardConfig:
 
 
 def reset_config():
-    """Reset config (for testing)"""
-    global _global_config
+    """Reset config and re-read the environment (for testing)"""
+    global _global_config, _env_cache
     _global_config = None
+    _env_cache = None
@@ -6,14 +6,20 @@ from .lease import Lease
 from .policy import Policy, PolicyRule, PolicyOutcome
 from .decision import Decision, DecisionOutcome
 from .audit import AuditEntry, AuditLog
-from .revocation import (
-    RevocationReason,
-    RevocationRecord,
-    RevocationLog,
-    Violation,
-    ViolationType,
-)
-from .watchdog import Watchdog, WatchdogRule, create_watchdog_with_defaults
+
+# The watchdog/revocation chain is only needed by monitoring paths;
+# importing it lazily (PEP 562) keeps it off the startup path of CLI
+# invocations that just touch leases, policies or audit
+_LAZY_IMPORTS = {
+    "RevocationReason": ".revocation",
+    "RevocationRecord": ".revocation",
+    "RevocationLog": ".revocation",
+    "Violation": ".revocation",
+    "ViolationType": ".revocation",
+    "Watchdog": ".watchdog",
+    "WatchdogRule": ".watchdog",
+    "create_watchdog_with_defaults": ".watchdog",
+}
 
 __all__ = [
     "Lease",
@@ -33,3 +39,15 @@ __all__ = [
     "WatchdogRule",
     "create_watchdog_with_defaults",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
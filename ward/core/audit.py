@@ -2,15 +2,17 @@
 Audit - Immutable records of authority decisions and actions
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import json
+import sys
 
 from .decision import Decision
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     """
     An immutable record of an authority decision or action.
@@ -29,9 +31,25 @@ class AuditEntry:
     known_unknowns: List[str] = field(default_factory=list)
     context: Dict[str, Any] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
+    # Cached serialized form (see to_dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self):
+        # Both fields draw from small value sets repeated across entries;
+        # interning makes the filter-scan comparisons pointer checks and
+        # dedups storage across a large log
+        self.event_type = sys.intern(self.event_type)
+        self.agent_id = sys.intern(self.agent_id)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize audit entry for storage/transmission"""
+        # Entries are append-only and never mutated, so the serialized
+        # form is computed once; repeated exports reuse it
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         result = {
             "entry_id": self.entry_id,
             "timestamp": self.timestamp.isoformat(),
@@ -51,11 +69,14 @@ class AuditEntry:
         if self.action_result:
             result["action_result"] = self.action_result
 
+        self._dict_cache = result
         return result
 
-    def to_json(self) -> str:
-        """Serialize to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+    def to_json(self, pretty: bool = False) -> str:
+        """Serialize to JSON string (compact unless pretty=True)"""
+        if pretty:
+            return json.dumps(self.to_dict(), indent=2)
+        return json.dumps(self.to_dict(), separators=(",", ":"))
 
     @staticmethod
     def from_decision(
@@ -110,32 +131,79 @@ class AuditLog:
 
     def __init__(self):
         self.entries: List[AuditEntry] = []
+        # Entries arrive in timestamp order; track the rare stale
+        # insert so get_recent only sorts when it has to
+        self._sorted_dirty = False
+        # Buckets maintained at append time so the filter queries are
+        # dict lookups instead of full-log scans
+        self._by_agent: Dict[str, List[AuditEntry]] = defaultdict(list)
+        self._by_type: Dict[str, List[AuditEntry]] = defaultdict(list)
+        self._by_unknown: Dict[str, List[AuditEntry]] = defaultdict(list)
 
     def append(self, entry: AuditEntry) -> None:
         """Add an entry to the audit log"""
-        self.entries.append(entry)
+        entries = self.entries
+        if entries and entry.timestamp < entries[-1].timestamp:
+            self._sorted_dirty = True
+        entries.append(entry)
+        self._by_agent[entry.agent_id].append(entry)
+        self._by_type[entry.event_type].append(entry)
+        for unknown in entry.known_unknowns:
+            self._by_unknown[unknown].append(entry)
 
     def get_entries_for_agent(self, agent_id: str) -> List[AuditEntry]:
         """Get all entries for a specific agent"""
-        return [e for e in self.entries if e.agent_id == agent_id]
+        return list(self._by_agent.get(agent_id, ()))
 
     def get_entries_by_type(self, event_type: str) -> List[AuditEntry]:
         """Get all entries of a specific type"""
-        return [e for e in self.entries if e.event_type == event_type]
+        return list(self._by_type.get(event_type, ()))
 
     def get_entries_with_unknown(self, unknown: str) -> List[AuditEntry]:
         """Find entries that flagged a specific unknown"""
-        return [e for e in self.entries if unknown in e.known_unknowns]
+        return list(self._by_unknown.get(unknown, ()))
 
     def get_recent(self, limit: int = 10) -> List[AuditEntry]:
         """Get the most recent entries"""
-        return sorted(self.entries, key=lambda e: e.timestamp, reverse=True)[:limit]
-
-    def to_json(self) -> str:
-        """Export entire log as JSON"""
-        return json.dumps([e.to_dict() for e in self.entries], indent=2)
+        if limit <= 0:
+            return []
+        if self._sorted_dirty:
+            self.entries.sort(key=lambda e: e.timestamp)
+            self._sorted_dirty = False
+        # Append-only and time-ordered, so the tail is the answer:
+        # O(limit) instead of sorting the whole log per query
+        return self.entries[-limit:][::-1]
+
+    def get_recent_for_agent(self, agent_id: str, limit: int = 10) -> List[AuditEntry]:
+        """Get the most recent entries for a specific agent"""
+        if limit <= 0:
+            return []
+        # Per-agent buckets fill in append order, so the tail is the
+        # recent slice — no filtering or sorting of the full log
+        bucket = self._by_agent.get(agent_id)
+        if not bucket:
+            return []
+        return bucket[-limit:][::-1]
+
+    def to_json(self, pretty: bool = False) -> str:
+        """Export entire log as JSON (compact unless pretty=True)"""
+        entries = [e.to_dict() for e in self.entries]
+        if pretty:
+            return json.dumps(entries, indent=2)
+        # indent forces json onto its pure-Python pretty-printer; the
+        # compact form keeps the C-accelerated fast path and avoids the
+        # whitespace blowup on large logs
+        return json.dumps(entries, separators=(",", ":"))
 
     def export_to_file(self, filepath: str) -> None:
         """Export log to a JSON file"""
+        # Stream one entry at a time instead of rendering the whole log
+        # into a single string first; peak memory stays at one entry
+        # rather than twice the serialized log
         with open(filepath, "w") as f:
-            f.write(self.to_json())
+            f.write("[\n")
+            last = len(self.entries) - 1
+            for i, entry in enumerate(self.entries):
+                json.dump(entry.to_dict(), f, indent=2)
+                f.write(",\n" if i != last else "\n")
+            f.write("]")
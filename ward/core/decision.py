@@ -4,11 +4,17 @@ Decision - The output of evaluating an action request
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
 from enum import Enum
 
 from .lease import Lease
 
+# Shared immutable empty mapping: decisions overwhelmingly carry no
+# constraints/context, so defaulting to this avoids two fresh dict
+# allocations per decision
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class DecisionOutcome(Enum):
     """Possible outcomes when an agent requests authority"""
@@ -18,7 +24,7 @@ class DecisionOutcome(Enum):
     NEEDS_HUMAN = "needs_human"
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """
     The result of evaluating whether an agent should be allowed
@@ -33,8 +39,10 @@ class Decision:
     reason: str
     timestamp: datetime = field(default_factory=datetime.now)
     lease: Optional[Lease] = None
-    constraints: Dict[str, Any] = field(default_factory=dict)
-    context: Dict[str, Any] = field(default_factory=dict)
+    # dataclasses refuses unhashable defaults, so the shared proxy goes
+    # through default_factory; every instance still gets the same object
+    constraints: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+    context: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
     policy_name: Optional[str] = None
     rule_name: Optional[str] = None
 
@@ -58,8 +66,10 @@ class Decision:
             "requested_action": self.requested_action,
             "reason": self.reason,
             "timestamp": self.timestamp.isoformat(),
-            "constraints": self.constraints,
-            "context": self.context,
+            # The shared empty proxy isn't JSON-serializable; emit a
+            # plain dict in its place
+            "constraints": self.constraints if self.constraints else {},
+            "context": self.context if self.context else {},
             "policy_name": self.policy_name,
             "rule_name": self.rule_name,
         }
@@ -86,7 +96,7 @@ class Decision:
             requested_action=requested_action,
             reason=reason,
             lease=lease,
-            constraints=constraints or {},
+            constraints=constraints if constraints else _EMPTY,
             policy_name=policy_name,
             rule_name=rule_name,
         )
@@ -124,7 +134,7 @@ class Decision:
             agent_id=agent_id,
             requested_action=requested_action,
             reason=reason,
-            context=context or {},
+            context=context if context else _EMPTY,
             policy_name=policy_name,
             rule_name=rule_name,
         )
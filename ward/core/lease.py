@@ -5,13 +5,14 @@ Lease - Represents granted authority to an agent
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import time
 import uuid
 
 if TYPE_CHECKING:
     from .revocation import RevocationReason
 
 
-@dataclass
+@dataclass(slots=True)
 class Lease:
     """
     A Lease grants an agent explicit authority to perform actions
@@ -32,26 +33,54 @@ class Lease:
     revoked_at: Optional[datetime] = None
     revoked_by: Optional[str] = None
     revocation_reason: Optional[str] = None  # Store as string to avoid circular import
+    # Internal expiry cache (see __post_init__)
+    _expires_at_cached: datetime = field(init=False, repr=False, compare=False, default=None)
+    _expires_at_ts: float = field(init=False, repr=False, compare=False, default=0.0)
+    # Frozen action sets for O(1) can_perform checks (see __post_init__)
+    _allowed_set: frozenset = field(init=False, repr=False, compare=False, default=frozenset())
+    _forbidden_set: frozenset = field(init=False, repr=False, compare=False, default=frozenset())
 
     def __post_init__(self):
         """Validate the lease on creation"""
-        if self.expires_at <= datetime.now():
+        # Cache expiry as an epoch float so validity checks compare two
+        # floats instead of allocating a datetime per check
+        self._expires_at_cached = self.expires_at
+        self._expires_at_ts = self.expires_at.timestamp()
+
+        if self._expires_at_ts <= time.time():
             raise ValueError("Lease cannot expire in the past")
 
         if self.max_steps is not None and self.max_steps <= 0:
             raise ValueError("max_steps must be positive if specified")
 
-        # Check for conflicts
-        conflicts = set(self.allowed_actions) & set(self.forbidden_actions)
-        if conflicts:
-            raise ValueError(f"Actions cannot be both allowed and forbidden: {conflicts}")
+        # Check for conflicts; forbidden_actions defaults empty, so skip
+        # building two sets per lease in the common case
+        if self.forbidden_actions:
+            conflicts = set(self.allowed_actions) & set(self.forbidden_actions)
+            if conflicts:
+                raise ValueError(f"Actions cannot be both allowed and forbidden: {conflicts}")
+            self._forbidden_set = frozenset(self.forbidden_actions)
+
+        # The action lists are effectively immutable after construction;
+        # frozen sets make can_perform O(1) instead of a linear scan
+        self._allowed_set = frozenset(self.allowed_actions)
+
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        """
+        Check if lease is currently valid.
 
-    def is_valid(self) -> bool:
-        """Check if lease is currently valid"""
+        Callers batch-checking many leases can pass `now` (an epoch
+        float from time.time()) to avoid a clock read per lease.
+        """
         if self.revoked:
             return False
 
-        if datetime.now() >= self.expires_at:
+        # Re-cache if expires_at was reassigned since construction
+        if self.expires_at is not self._expires_at_cached:
+            self._expires_at_cached = self.expires_at
+            self._expires_at_ts = self.expires_at.timestamp()
+
+        if (time.time() if now is None else now) >= self._expires_at_ts:
             return False
 
         if self.max_steps is not None and self.steps_taken >= self.max_steps:
@@ -59,17 +88,17 @@ class Lease:
 
         return True
 
-    def can_perform(self, action: str) -> bool:
+    def can_perform(self, action: str, now: Optional[float] = None) -> bool:
         """Check if this lease allows a specific action"""
-        if not self.is_valid():
+        if not self.is_valid(now):
             return False
 
         # Explicit deny takes precedence
-        if action in self.forbidden_actions:
+        if action in self._forbidden_set:
             return False
 
         # Must be explicitly allowed
-        return action in self.allowed_actions
+        return action in self._allowed_set
 
     def record_step(self) -> None:
         """Record that the agent took one step under this lease"""
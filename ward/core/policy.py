@@ -5,6 +5,7 @@ Policy - Rule-based decision engine for action approval
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
+import functools
 import re
 
 
@@ -16,7 +17,7 @@ class PolicyOutcome(Enum):
     NEEDS_HUMAN = "needs_human"
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyRule:
     """
     A single rule in a policy.
@@ -31,23 +32,35 @@ class PolicyRule:
     scope_constraints: Dict[str, Any] = field(default_factory=dict)
     max_duration_minutes: Optional[int] = None
     max_steps: Optional[int] = None
+    # Compiled form of action_pattern (see __post_init__)
+    _compiled: "re.Pattern" = field(init=False, repr=False, compare=False, default=None)
+    _scope_items: tuple = field(init=False, repr=False, compare=False, default=())
+
+    def __post_init__(self):
+        # Compile once at construction; re.match with a string pattern
+        # pays an re._cache lookup on every evaluation. Scope constraints
+        # are snapshot as a tuple so matches() iterates without calling
+        # .items() per evaluation
+        self._compiled = re.compile(self.action_pattern)
+        self._scope_items = tuple(self.scope_constraints.items())
 
     def matches(self, action: str, context: Optional[Dict[str, Any]] = None) -> bool:
         """Check if this rule matches the given action and context"""
         # Check action pattern
-        if not re.match(self.action_pattern, action):
+        if not self._compiled.match(action):
             return False
 
-        # Check scope constraints if provided
-        if context and self.scope_constraints:
-            for key, expected_value in self.scope_constraints.items():
+        # Check scope constraints if provided; unscoped rules (the
+        # common case) skip straight to the answer
+        if context and self._scope_items:
+            for key, expected_value in self._scope_items:
                 if context.get(key) != expected_value:
                     return False
 
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """
     A collection of rules that determine what actions are allowed.
@@ -60,6 +73,39 @@ class Policy:
     rules: List[PolicyRule]
     default_outcome: PolicyOutcome = PolicyOutcome.DENY
     default_reason: str = "No matching policy rule"
+    # Fused alternation of all rule patterns (see __post_init__)
+    _fused: Optional["re.Pattern"] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _fused_rule_count: int = field(init=False, repr=False, compare=False, default=-1)
+    _has_scoped_rules: bool = field(init=False, repr=False, compare=False, default=False)
+    _dispatch: tuple = field(init=False, repr=False, compare=False, default=())
+
+    def __post_init__(self):
+        # Fuse all rule patterns into one alternation so evaluate() is a
+        # single C-level regex scan instead of one re.match per rule.
+        # Alternatives are tried left to right at position 0, which
+        # preserves first-match-wins rule order; m.lastindex names the
+        # alternative that matched. Only group-free patterns are fused —
+        # inner groups or backreferences would be renumbered by fusion.
+        self._has_scoped_rules = any(r.scope_constraints for r in self.rules)
+        self._fused_rule_count = len(self.rules)
+        if self.rules and all(
+            "(" not in r.action_pattern and "\\" not in r.action_pattern
+            for r in self.rules
+        ):
+            self._fused = re.compile(
+                "|".join(f"({r.action_pattern})" for r in self.rules)
+            )
+        else:
+            self._fused = None
+        # Specialized dispatch table for the per-rule path: bound match
+        # methods, snapshot scope items and prebuilt result tuples, so
+        # the loop does no attribute lookups or tuple packing per call
+        self._dispatch = tuple(
+            (r._compiled.match, r._scope_items, (r.outcome, r.reason, r))
+            for r in self.rules
+        )
 
     def evaluate(
         self, action: str, context: Optional[Dict[str, Any]] = None
@@ -69,6 +115,33 @@ class Policy:
 
         Returns: (outcome, reason, matching_rule)
         """
+        # Fast path: one fused scan when scope constraints can't veto a
+        # pattern match (no context, or no scoped rules to check)
+        if (
+            self._fused is not None
+            and len(self.rules) == self._fused_rule_count
+            and (not context or not self._has_scoped_rules)
+        ):
+            m = self._fused.match(action)
+            if m is None:
+                return (self.default_outcome, self.default_reason, None)
+            rule = self.rules[m.lastindex - 1]
+            return (rule.outcome, rule.reason, rule)
+
+        if len(self.rules) == self._fused_rule_count:
+            for match, scope_items, result in self._dispatch:
+                if match(action):
+                    if context and scope_items:
+                        if any(
+                            context.get(key) != expected
+                            for key, expected in scope_items
+                        ):
+                            continue
+                    return result
+            return (self.default_outcome, self.default_reason, None)
+
+        # Rules were mutated after construction; fall back to the
+        # general per-rule path
         for rule in self.rules:
             if rule.matches(action, context):
                 return (rule.outcome, rule.reason, rule)
@@ -100,49 +173,61 @@ class Policy:
 
     @staticmethod
     def create_default() -> "Policy":
-        """Create a sensible default policy for common scenarios"""
-        return Policy(
-            name="default",
-            rules=[
-                # Production operations require human approval
-                PolicyRule(
-                    name="production_deploy",
-                    action_pattern=r"deploy_prod.*",
-                    outcome=PolicyOutcome.NEEDS_HUMAN,
-                    reason="Production deployments require human approval",
-                ),
-                PolicyRule(
-                    name="production_write",
-                    action_pattern=r".*_prod.*",
-                    outcome=PolicyOutcome.NEEDS_HUMAN,
-                    reason="Production modifications require human approval",
-                ),
-                # Destructive operations are denied
-                PolicyRule(
-                    name="delete_production",
-                    action_pattern=r"delete_prod.*",
-                    outcome=PolicyOutcome.DENY,
-                    reason="Direct production deletion is not allowed",
-                ),
-                # Staging operations are allowed with limits
-                PolicyRule(
-                    name="staging_deploy",
-                    action_pattern=r"deploy_staging",
-                    outcome=PolicyOutcome.ALLOW,
-                    reason="Staging deployments are pre-approved",
-                    scope_constraints={"environment": "staging"},
-                    max_steps=50,
-                    max_duration_minutes=30,
-                ),
-                # Read operations are generally allowed
-                PolicyRule(
-                    name="read_operations",
-                    action_pattern=r"read_.*|get_.*|list_.*",
-                    outcome=PolicyOutcome.ALLOW,
-                    reason="Read operations are safe",
-                    max_steps=100,
-                ),
-            ],
-            default_outcome=PolicyOutcome.NEEDS_HUMAN,
-            default_reason="Unknown action requires human review",
-        )
+        """
+        Create a sensible default policy for common scenarios.
+
+        Returns a shared instance: the policy is immutable in practice,
+        and rebuilding five rules (and their compiled patterns) per call
+        adds up for callers that reset context per request.
+        """
+        return _build_default_policy()
+
+
+@functools.cache
+def _build_default_policy() -> Policy:
+    """Construct the default policy (cached; see Policy.create_default)"""
+    return Policy(
+        name="default",
+        rules=[
+            # Production operations require human approval
+            PolicyRule(
+                name="production_deploy",
+                action_pattern=r"deploy_prod.*",
+                outcome=PolicyOutcome.NEEDS_HUMAN,
+                reason="Production deployments require human approval",
+            ),
+            PolicyRule(
+                name="production_write",
+                action_pattern=r".*_prod.*",
+                outcome=PolicyOutcome.NEEDS_HUMAN,
+                reason="Production modifications require human approval",
+            ),
+            # Destructive operations are denied
+            PolicyRule(
+                name="delete_production",
+                action_pattern=r"delete_prod.*",
+                outcome=PolicyOutcome.DENY,
+                reason="Direct production deletion is not allowed",
+            ),
+            # Staging operations are allowed with limits
+            PolicyRule(
+                name="staging_deploy",
+                action_pattern=r"deploy_staging",
+                outcome=PolicyOutcome.ALLOW,
+                reason="Staging deployments are pre-approved",
+                scope_constraints={"environment": "staging"},
+                max_steps=50,
+                max_duration_minutes=30,
+            ),
+            # Read operations are generally allowed
+            PolicyRule(
+                name="read_operations",
+                action_pattern=r"read_.*|get_.*|list_.*",
+                outcome=PolicyOutcome.ALLOW,
+                reason="Read operations are safe",
+                max_steps=100,
+            ),
+        ],
+        default_outcome=PolicyOutcome.NEEDS_HUMAN,
+        default_reason="Unknown action requires human review",
+    )
@@ -2,12 +2,29 @@
 Revocation - Primitives for invalidating leases and tracking violations
 """
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from enum import Enum
 import json
 
+# Optional fast path for JSON export (the "fast-json" extra); the
+# stdlib fallback keeps the same output shape
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any, pretty: bool) -> str:
+    """Serialize to a JSON string, compact unless pretty is set"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
 
 class RevocationReason(Enum):
     """Reasons why a lease might be revoked"""
@@ -30,7 +47,7 @@ class ViolationType(Enum):
     EXPIRED_LEASE_USAGE = "expired_lease_usage"
 
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     """
     A detected violation of lease constraints or policies.
@@ -47,9 +64,16 @@ class Violation:
     severity: str  # "low", "medium", "high", "critical"
     context: Dict[str, Any] = field(default_factory=dict)
     auto_revoke: bool = False
+    # Rules that fire often can defer building their context dict until
+    # someone actually serializes the violation; the factory runs once
+    # and its result replaces it
+    context_factory: Optional[Callable[[], Dict[str, Any]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize violation for logging"""
+        if self.context_factory is not None:
+            self.context = self.context_factory()
+            self.context_factory = None
         return {
             "violation_id": self.violation_id,
             "violation_type": self.violation_type.value,
@@ -63,7 +87,7 @@ class Violation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RevocationRecord:
     """
     An immutable record of a lease revocation.
@@ -81,10 +105,18 @@ class RevocationRecord:
     description: str
     violations: List[str] = field(default_factory=list)  # violation_ids
     context: Dict[str, Any] = field(default_factory=dict)
+    # Cached serialized form (see to_dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize revocation record"""
-        return {
+        # Records are immutable, so the serialized form is computed once
+        # and reused across repeated exports
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "record_id": self.record_id,
             "lease_id": self.lease_id,
             "agent_id": self.agent_id,
@@ -95,10 +127,11 @@ class RevocationRecord:
             "violations": self.violations,
             "context": self.context,
         }
+        return self._dict_cache
 
-    def to_json(self) -> str:
-        """Serialize to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+    def to_json(self, pretty: bool = False) -> str:
+        """Serialize to JSON string (compact unless pretty=True)"""
+        return _dumps(self.to_dict(), pretty)
 
 
 class RevocationLog:
@@ -111,33 +144,52 @@ class RevocationLog:
 
     def __init__(self):
         self.records: List[RevocationRecord] = []
+        # Secondary indexes maintained at record time so the filter
+        # queries don't scan the full history
+        self._by_agent: Dict[str, List[RevocationRecord]] = defaultdict(list)
+        self._by_reason: Dict[RevocationReason, List[RevocationRecord]] = defaultdict(
+            list
+        )
+        self._counts_by_reason: Counter = Counter()
+        # Records arrive in timestamp order; track the rare stale insert
+        # so get_recent only sorts when it has to
+        self._sorted_dirty = False
 
     def record_revocation(self, record: RevocationRecord) -> None:
         """Add a revocation record"""
-        self.records.append(record)
+        records = self.records
+        if records and record.timestamp < records[-1].timestamp:
+            self._sorted_dirty = True
+        records.append(record)
+        self._by_agent[record.agent_id].append(record)
+        self._by_reason[record.reason].append(record)
+        self._counts_by_reason[record.reason.value] += 1
 
     def get_revocations_for_agent(self, agent_id: str) -> List[RevocationRecord]:
         """Get all revocations for a specific agent"""
-        return [r for r in self.records if r.agent_id == agent_id]
+        return list(self._by_agent.get(agent_id, ()))
 
     def get_revocations_by_reason(
         self, reason: RevocationReason
     ) -> List[RevocationRecord]:
         """Get all revocations for a specific reason"""
-        return [r for r in self.records if r.reason == reason]
+        return list(self._by_reason.get(reason, ()))
 
     def get_recent(self, limit: int = 10) -> List[RevocationRecord]:
         """Get the most recent revocations"""
-        return sorted(self.records, key=lambda r: r.timestamp, reverse=True)[:limit]
+        if limit <= 0:
+            return []
+        if self._sorted_dirty:
+            self.records.sort(key=lambda r: r.timestamp)
+            self._sorted_dirty = False
+        # Append-only and time-ordered, so the tail is the answer:
+        # O(limit) instead of sorting the whole history per poll
+        return self.records[-limit:][::-1]
 
     def count_revocations(self) -> Dict[str, int]:
         """Get counts by reason"""
-        counts = {}
-        for record in self.records:
-            reason = record.reason.value
-            counts[reason] = counts.get(reason, 0) + 1
-        return counts
-
-    def to_json(self) -> str:
-        """Export entire log as JSON"""
-        return json.dumps([r.to_dict() for r in self.records], indent=2)
+        return dict(self._counts_by_reason)
+
+    def to_json(self, pretty: bool = False) -> str:
+        """Export entire log as JSON (compact unless pretty=True)"""
+        return _dumps([r.to_dict() for r in self.records], pretty)
@@ -5,13 +5,25 @@ Watchdog - Monitors leases and detects violations
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Callable
-from collections import defaultdict
+from collections import defaultdict, deque
+import itertools
 
 from .lease import Lease
 from .revocation import Violation, ViolationType, RevocationReason
 
+# Process-wide violation id source. Violations live in memory only, so
+# a counter is unique where it needs to be and avoids the clock read
+# and float formatting of the previous timestamp-derived ids (which
+# could also collide within one timer tick)
+_violation_ids = itertools.count()
 
-@dataclass
+
+def _next_violation_id() -> str:
+    """Allocate the next violation id"""
+    return f"violation-{next(_violation_ids)}"
+
+
+@dataclass(slots=True)
 class WatchdogRule:
     """
     A rule that defines what the watchdog should check.
@@ -24,6 +36,9 @@ class WatchdogRule:
     severity: str  # "low", "medium", "high", "critical"
     auto_revoke: bool = False
     description: str = ""
+    # Context keys this rule needs before its check can fire; rules
+    # that run on every check keep the "always" default
+    triggers_on: frozenset = frozenset({"always"})
 
 
 class Watchdog:
@@ -34,10 +49,22 @@ class Watchdog:
     and reports violations. It does not make decisions.
     """
 
-    def __init__(self):
+    def __init__(self, history_window: int = 256):
         self.rules: List[WatchdogRule] = []
-        self.violations: List[Violation] = []
-        self.action_history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # Violations are stored keyed by lease so per-lease lookups and
+        # clears touch only that lease's entries instead of rescanning
+        # the full history on every lease teardown
+        self.violations: Dict[str, List[Violation]] = defaultdict(list)
+        # Pattern detection only ever looks at a recent window, so cap
+        # the per-lease history; a bounded deque keeps memory flat for
+        # long-lived agents and makes appends drop the oldest entry
+        self._history_window = history_window
+        self.action_history: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self._history_window)
+        )
+        # Pending auto-revoke violations, queued as they fire so the
+        # supervisor poll doesn't rescan the whole violation history
+        self._auto_revoke_queue: deque = deque()
 
     def add_rule(self, rule: WatchdogRule) -> None:
         """Add a monitoring rule"""
@@ -52,46 +79,74 @@ class Watchdog:
         Returns a list of detected violations.
         """
         context = context or {}
+        # One clock read shared by every rule in this check; rules pick
+        # it up via context["_now"] instead of calling datetime.now()
+        # per guard and per violation
+        context["_now"] = datetime.now()
         violations = []
 
         for rule in self.rules:
+            # Skip rules whose required context keys are absent before
+            # paying for the check call frame; iteration order (and so
+            # violation order) matches the rule list
+            triggers = rule.triggers_on
+            if "always" not in triggers and not triggers.intersection(context):
+                continue
             violation = rule.check(lease, context)
             if violation:
                 violation.auto_revoke = rule.auto_revoke
                 violations.append(violation)
-                self.violations.append(violation)
+                self.violations[violation.lease_id].append(violation)
+                if rule.auto_revoke:
+                    self._auto_revoke_queue.append(violation)
 
         return violations
 
     def record_action(
-        self, lease_id: str, action: str, result: Optional[Dict[str, Any]] = None
+        self,
+        lease_id: str,
+        action: str,
+        result: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
     ) -> None:
         """
         Record an action for pattern analysis.
 
-        This builds history that can be used for suspicious pattern detection.
+        This builds history that can be used for suspicious pattern
+        detection. Callers that already hold a clock reading can pass it
+        as timestamp to skip the datetime.now() call.
         """
         self.action_history[lease_id].append(
             {
                 "action": action,
-                "timestamp": datetime.now(),
+                "timestamp": timestamp or datetime.now(),
                 "result": result or {},
             }
         )
 
     def get_violations_for_lease(self, lease_id: str) -> List[Violation]:
         """Get all violations for a specific lease"""
-        return [v for v in self.violations if v.lease_id == lease_id]
+        return list(self.violations.get(lease_id, ()))
 
     def get_violations_requiring_revocation(self) -> List[Violation]:
         """Get all violations marked for auto-revocation"""
-        return [v for v in self.violations if v.auto_revoke]
+        return list(self._auto_revoke_queue)
+
+    def drain_violations_requiring_revocation(self) -> List[Violation]:
+        """Return pending auto-revoke violations and clear the queue"""
+        pending = list(self._auto_revoke_queue)
+        self._auto_revoke_queue.clear()
+        return pending
 
     def clear_violations_for_lease(self, lease_id: str) -> None:
         """Clear violations for a revoked/expired lease"""
-        self.violations = [v for v in self.violations if v.lease_id != lease_id]
-        if lease_id in self.action_history:
-            del self.action_history[lease_id]
+        if self.violations.pop(lease_id, None) is not None:
+            # The pending queue is small (only unprocessed auto-revokes),
+            # so a filter pass here is cheap
+            self._auto_revoke_queue = deque(
+                v for v in self._auto_revoke_queue if v.lease_id != lease_id
+            )
+        self.action_history.pop(lease_id, None)
 
     @staticmethod
     def create_default_rules() -> List[WatchdogRule]:
@@ -100,96 +155,106 @@ class Watchdog:
 
         These are boring, deterministic checks.
         """
+        return list(_DEFAULT_RULES)
+
+
+def _check_expired_usage(lease: Lease, context: Dict[str, Any]) -> Optional[Violation]:
+    """Check if an expired lease is being used"""
+    now = context.get("_now") or datetime.now()
+    if not lease.is_valid() and now >= lease.expires_at:
+        return Violation(
+            violation_id=_next_violation_id(),
+            violation_type=ViolationType.EXPIRED_LEASE_USAGE,
+            lease_id=lease.lease_id,
+            agent_id=lease.agent_id,
+            timestamp=now,
+            description="Attempted to use expired lease",
+            severity="high",
+            context={"expires_at": lease.expires_at.isoformat()},
+        )
+    return None
+
+
+def _check_scope_violation(
+    lease: Lease, context: Dict[str, Any]
+) -> Optional[Violation]:
+    """Check if action violates lease scope"""
+    action = context.get("action")
+    if not action:
+        return None
+
+    # Membership against the lease's precomputed frozenset is a hash
+    # lookup instead of a list scan over allowed_actions
+    if action not in lease._allowed_set:
+        return Violation(
+            violation_id=_next_violation_id(),
+            violation_type=ViolationType.ACTION_NOT_ALLOWED,
+            lease_id=lease.lease_id,
+            agent_id=lease.agent_id,
+            timestamp=context.get("_now") or datetime.now(),
+            description=f"Action '{action}' not in allowed actions",
+            severity="high",
+            # Deferred: only materializes (and copies allowed_actions)
+            # if the violation is serialized
+            context_factory=lambda a=action, allowed=lease.allowed_actions: {
+                "attempted_action": a,
+                "allowed_actions": list(allowed),
+            },
+        )
+    return None
+
+
+def _check_rate_limit(lease: Lease, context: Dict[str, Any]) -> Optional[Violation]:
+    """Check if lease is being used too rapidly"""
+    if lease.max_steps and lease.steps_taken > lease.max_steps * 1.1:
+        return Violation(
+            violation_id=_next_violation_id(),
+            violation_type=ViolationType.RATE_LIMIT_EXCEEDED,
+            lease_id=lease.lease_id,
+            agent_id=lease.agent_id,
+            timestamp=context.get("_now") or datetime.now(),
+            description=f"Exceeded step limit by >10%",
+            severity="medium",
+            context={
+                "max_steps": lease.max_steps,
+                "steps_taken": lease.steps_taken,
+            },
+        )
+    return None
+
 
-        def check_expired_usage(
-            lease: Lease, context: Dict[str, Any]
-        ) -> Optional[Violation]:
-            """Check if an expired lease is being used"""
-            if not lease.is_valid() and datetime.now() >= lease.expires_at:
-                return Violation(
-                    violation_id=f"violation-{datetime.now().timestamp()}",
-                    violation_type=ViolationType.EXPIRED_LEASE_USAGE,
-                    lease_id=lease.lease_id,
-                    agent_id=lease.agent_id,
-                    timestamp=datetime.now(),
-                    description="Attempted to use expired lease",
-                    severity="high",
-                    context={"expires_at": lease.expires_at.isoformat()},
-                )
-            return None
-
-        def check_scope_violation(
-            lease: Lease, context: Dict[str, Any]
-        ) -> Optional[Violation]:
-            """Check if action violates lease scope"""
-            action = context.get("action")
-            if not action:
-                return None
-
-            if action not in lease.allowed_actions:
-                return Violation(
-                    violation_id=f"violation-{datetime.now().timestamp()}",
-                    violation_type=ViolationType.ACTION_NOT_ALLOWED,
-                    lease_id=lease.lease_id,
-                    agent_id=lease.agent_id,
-                    timestamp=datetime.now(),
-                    description=f"Action '{action}' not in allowed actions",
-                    severity="high",
-                    context={
-                        "attempted_action": action,
-                        "allowed_actions": lease.allowed_actions,
-                    },
-                )
-            return None
-
-        def check_rate_limit(
-            lease: Lease, context: Dict[str, Any]
-        ) -> Optional[Violation]:
-            """Check if lease is being used too rapidly"""
-            if lease.max_steps and lease.steps_taken > lease.max_steps * 1.1:
-                return Violation(
-                    violation_id=f"violation-{datetime.now().timestamp()}",
-                    violation_type=ViolationType.RATE_LIMIT_EXCEEDED,
-                    lease_id=lease.lease_id,
-                    agent_id=lease.agent_id,
-                    timestamp=datetime.now(),
-                    description=f"Exceeded step limit by >10%",
-                    severity="medium",
-                    context={
-                        "max_steps": lease.max_steps,
-                        "steps_taken": lease.steps_taken,
-                    },
-                )
-            return None
-
-        return [
-            WatchdogRule(
-                name="expired_lease_check",
-                check=check_expired_usage,
-                severity="high",
-                auto_revoke=True,
-                description="Detect usage of expired leases",
-            ),
-            WatchdogRule(
-                name="scope_violation_check",
-                check=check_scope_violation,
-                severity="high",
-                auto_revoke=True,
-                description="Detect actions outside lease scope",
-            ),
-            WatchdogRule(
-                name="rate_limit_check",
-                check=check_rate_limit,
-                severity="medium",
-                auto_revoke=False,
-                description="Detect excessive action rates",
-            ),
-        ]
+# The default rules are stateless, so one set of rule objects built at
+# import time serves every Watchdog; create_default_rules hands out
+# copies of this tuple instead of rebuilding closures per call
+_DEFAULT_RULES: tuple = (
+    WatchdogRule(
+        name="expired_lease_check",
+        check=_check_expired_usage,
+        severity="high",
+        auto_revoke=True,
+        description="Detect usage of expired leases",
+    ),
+    WatchdogRule(
+        name="scope_violation_check",
+        check=_check_scope_violation,
+        severity="high",
+        auto_revoke=True,
+        description="Detect actions outside lease scope",
+        triggers_on=frozenset({"action"}),
+    ),
+    WatchdogRule(
+        name="rate_limit_check",
+        check=_check_rate_limit,
+        severity="medium",
+        auto_revoke=False,
+        description="Detect excessive action rates",
+    ),
+)
 
 
 def create_watchdog_with_defaults() -> Watchdog:
     """Create a Watchdog with default rules installed"""
     watchdog = Watchdog()
-    for rule in Watchdog.create_default_rules():
+    for rule in _DEFAULT_RULES:
         watchdog.add_rule(rule)
     return watchdog
@@ -11,29 +11,84 @@ Usage:
     Terminal 1: (agent auto-resumes)
 """
 
+import asyncio
 import sys
 import os
 import json
+import re
 import uuid
-import time
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from ward.core import Policy, PolicyRule, PolicyOutcome, DecisionOutcome
-from ward.agent import ShellAgent, AsyncAgent
-from ward.storage import SQLiteAuditBackend
+# Installed checkouts (pip install -e .) import ward directly; only
+# fall back to path munging when running the file straight from a
+# source tree, so the common case skips the import-time sys.path edit
+try:
+    from ward.core import Policy, PolicyRule, PolicyOutcome, DecisionOutcome
+    from ward.agent import ShellAgent, AsyncAgent
+    from ward.storage import SQLiteAuditBackend
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from ward.core import Policy, PolicyRule, PolicyOutcome, DecisionOutcome
+    from ward.agent import ShellAgent, AsyncAgent
+    from ward.storage import SQLiteAuditBackend
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except ImportError:
     print("Error: openai package not installed")
     print("Install with: pip install openai")
     sys.exit(1)
 
+# Per-call JSON blobs (tool arguments in, action strings out) go
+# through orjson when the fast-json extra is installed; the stdlib
+# fallback produces the same compact output
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0
+        ).decode()
+
+except ImportError:
+
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"))
+
+
+# Tool schema sent with every completion call; built once at import
+# rather than per agent instance, and a tuple so it can't be mutated
+_TOOLS_SCHEMA = (
+    {
+        "type": "function",
+        "function": {
+            "name": "execute_bash",
+            "description": "Execute a bash command",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "command": {"type": "string"},
+                    "environment": {
+                        "type": "string",
+                        "enum": ["dev", "staging", "prod"],
+                    },
+                },
+                "required": ["command", "environment"],
+            },
+        },
+    },
+)
+
 
 class AsyncDeepSeekAgent(AsyncAgent):
     """
@@ -53,10 +108,13 @@ class AsyncDeepSeekAgent(AsyncAgent):
         db_path: str = "deepseek_async.db",
         poll_interval: int = 2,
     ):
-        # Initialize AsyncAgent base class
+        # Initialize AsyncAgent base class. batch_writes amortizes the
+        # per-record commit fsync across bursts of record_action calls
+        # (parallel approvals write several at once); reads flush the
+        # queue first, so read-your-writes still holds.
         super().__init__(
             agent_id=agent_id,
-            backend=SQLiteAuditBackend(db_path),
+            backend=SQLiteAuditBackend(db_path, batch_writes=True),
             poll_interval=poll_interval,
         )
 
@@ -79,35 +137,27 @@ class AsyncDeepSeekAgent(AsyncAgent):
             print("\nRunning in demo mode...")
             self.client = None
         else:
-            self.client = OpenAI(
+            # Async client so approval polling and console input can
+            # share the event loop with in-flight completions
+            self.client = AsyncOpenAI(
                 base_url=base_url,
                 api_key=api_key,
             )
             if os.environ.get("WARD_VERBOSE"):
                 print(f"Using LLM endpoint: {base_url}")
 
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "execute_bash",
-                    "description": "Execute a bash command",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "command": {"type": "string"},
-                            "environment": {
-                                "type": "string",
-                                "enum": ["dev", "staging", "prod"],
-                            },
-                        },
-                        "required": ["command", "environment"],
-                    },
-                },
-            }
-        ]
+        self.tools = _TOOLS_SCHEMA
 
         self.conversation_history = []
+        # Rolling digest of turns evicted from the prompt window (see
+        # _trim_messages)
+        self._summary: Optional[str] = None
+        # Approved commands are independent; a small pool runs them
+        # concurrently so a bulk approval costs max(T_i) not sum(T_i)
+        self._exec_pool = ThreadPoolExecutor(max_workers=4)
+        # tool_call_id -> tool message dict, so late approval results
+        # patch the conversation in O(1) instead of rescanning it
+        self._tool_msg_index: Dict[str, Dict[str, Any]] = {}
 
     def request_tool_execution(
         self, tool_name: str, tool_args: Dict[str, Any], tool_call_id: Optional[str] = None
@@ -122,7 +172,9 @@ class AsyncDeepSeekAgent(AsyncAgent):
         """
         # Build context
         context = self._build_context(tool_name, tool_args)
-        action = f"{tool_name}({json.dumps(tool_args)})"
+        # Serialized once here and reused by _execute_tool's audit
+        # records instead of re-encoding per branch
+        action = f"{tool_name}({_json_dumps(tool_args)})"
 
         print(f"\n🔍 Requesting: {tool_name}")
         print(f"   Context: {context}")
@@ -133,9 +185,11 @@ class AsyncDeepSeekAgent(AsyncAgent):
         # Handle outcome
         if decision.outcome == DecisionOutcome.APPROVED:
             print(f"   ✅ Auto-approved by policy: {decision.rule_name}")
-            # Execute immediately
-            lease_id = self._get_lease_id(decision)
-            result = self._execute_tool(tool_name, tool_args, lease_id)
+            # Execute immediately with the lease the decision already
+            # carries; re-querying "newest approved decision" was both
+            # an extra round-trip and racy under concurrent agents
+            lease_id = decision.lease.lease_id if decision.lease else str(uuid.uuid4())
+            result = self._execute_tool(tool_name, tool_args, lease_id, action)
             return {"status": "executed", "result": result}
 
         elif decision.outcome == DecisionOutcome.NEEDS_HUMAN:
@@ -177,15 +231,28 @@ class AsyncDeepSeekAgent(AsyncAgent):
         Returns list of executed results for approved items.
         For denied items, returns denial message.
         """
-        # Use base class method with execution callback
-        def execute_callback(action_name: str, action_args: Dict[str, Any], lease_id: str) -> str:
-            """Execute the tool when approved"""
+        # Use base class method with execution callback. The callback
+        # only submits to the pool, so approved commands from one poll
+        # tick run in parallel; futures are resolved below.
+        def execute_callback(action_name: str, action_args: Dict[str, Any], lease_id: str) -> Future:
+            """Queue the tool for execution when approved"""
             print(f"\n✅ Approval detected...")
             print(f"   Executing: {action_name}")
-            return self._execute_tool(action_name, action_args, lease_id)
+            return self._exec_pool.submit(
+                self._execute_tool, action_name, action_args, lease_id
+            )
 
         results = super().check_pending_approvals(execute_callback)
 
+        # Wait for the submitted executions and unwrap their results
+        for result in results:
+            if isinstance(result["result"], Future):
+                try:
+                    result["result"] = result["result"].result()
+                except Exception as e:
+                    result["result"] = f"Execution error: {str(e)}"
+                    result["status"] = "error"
+
         # Print status for each result
         for result in results:
             decision_id = result["decision_id"]
@@ -211,15 +278,136 @@ class AsyncDeepSeekAgent(AsyncAgent):
             for r in results
         ]
 
-    def _get_lease_id(self, decision) -> str:
-        """Extract lease ID from decision"""
-        # For auto-approved decisions, get from database
-        decisions = self.backend.get_decisions(
-            agent_id=self.agent_id, outcome="approved", limit=1
+    # Raw turns kept verbatim in the prompt; older turns fold into the
+    # rolling digest. Keeps per-iteration prompt size bounded instead of
+    # growing with conversation age.
+    _HISTORY_WINDOW = 12
+    # Tail cap on the digest itself so it can't grow without bound either
+    _SUMMARY_MAX_CHARS = 4000
+
+    def _trim_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bound the prompt sent to the LLM.
+
+        Keeps the leading system prompt plus the most recent turns
+        verbatim and folds anything older into a one-line-per-turn
+        digest carried as a second system message. A model-written
+        rolling summary would compress better, but the local digest
+        costs no extra API call and keeps the example self-contained.
+        Evicted turns are dropped from the live list, so memory stays
+        bounded too.
+        """
+        head = 1 if messages and messages[0]["role"] == "system" else 0
+
+        if len(messages) - head > self._HISTORY_WINDOW:
+            cut = len(messages) - self._HISTORY_WINDOW
+            # Never open the window on a tool reply whose assistant
+            # tool_calls message was evicted
+            while cut < len(messages) and messages[cut].get("role") == "tool":
+                cut += 1
+
+            lines = []
+            for msg in messages[head:cut]:
+                if msg.get("tool_calls"):
+                    calls = ", ".join(
+                        tc["function"]["name"] for tc in msg["tool_calls"]
+                    )
+                    lines.append(f"[assistant] requested tools: {calls}")
+                elif msg.get("content"):
+                    lines.append(f"[{msg['role']}] {msg['content'][:200]}")
+
+            if lines:
+                joined = "\n".join(lines)
+                self._summary = (
+                    f"{self._summary}\n{joined}"
+                    if self._summary
+                    else f"Summary of earlier turns:\n{joined}"
+                )
+                self._summary = self._summary[-self._SUMMARY_MAX_CHARS :]
+
+            del messages[head:cut]
+
+        if self._summary:
+            return (
+                messages[:head]
+                + [{"role": "system", "content": self._summary}]
+                + messages[head:]
+            )
+        return messages
+
+    def _apply_interactive_outcome(
+        self, decision_ids: List[str], approve: bool
+    ) -> None:
+        """
+        Approve or deny pending decisions in-process.
+
+        Mirrors the CLI's batched approve/deny path: one
+        apply_human_decisions call covers the whole batch under a single
+        commit, instead of spawning a ward CLI subprocess (interpreter
+        startup plus a fresh database open) per decision.
+        """
+        rationale = (
+            "Approved via interactive prompt"
+            if approve
+            else "Denied via interactive prompt"
         )
-        if decisions:
-            return decisions[0].get("lease_id", str(uuid.uuid4()))
-        return str(uuid.uuid4())
+        expires_at_iso = (datetime.now() + timedelta(minutes=5)).isoformat()
+
+        decision_updates = []
+        actions = []
+        approvals = []
+
+        for decision_id in decision_ids:
+            if approve:
+                lease_id = str(uuid.uuid4())
+                decision_updates.append(("approved", lease_id, decision_id))
+                actions.append(
+                    dict(
+                        action_id=f"approval-{uuid.uuid4()}",
+                        agent_id="human:interactive",
+                        action="approve_decision",
+                        status="approved",
+                        result={
+                            "decision_id": decision_id,
+                            "lease_id": lease_id,
+                            "max_steps": 1,
+                            "expires_at": expires_at_iso,
+                        },
+                        tags=["approval", "interactive"],
+                    )
+                )
+                approvals.append(
+                    dict(
+                        approval_id=f"human-{uuid.uuid4()}",
+                        decision_id=decision_id,
+                        human_outcome="approved",
+                        actual_max_steps=1,
+                        actual_duration_minutes=5,
+                        rationale=rationale,
+                    )
+                )
+            else:
+                decision_updates.append(("denied", None, decision_id))
+                actions.append(
+                    dict(
+                        action_id=f"denial-{uuid.uuid4()}",
+                        agent_id="human:interactive",
+                        action="deny_decision",
+                        status="denied",
+                        result={"decision_id": decision_id, "reason": rationale},
+                        tags=["denial", "interactive"],
+                    )
+                )
+                approvals.append(
+                    dict(
+                        approval_id=f"human-{uuid.uuid4()}",
+                        decision_id=decision_id,
+                        human_outcome="denied",
+                        rationale=rationale,
+                    )
+                )
+
+        self.backend.apply_human_decisions(decision_updates, actions, approvals)
 
     def _build_context(
         self, tool_name: str, tool_args: Dict[str, Any]
@@ -238,21 +426,25 @@ class AsyncDeepSeekAgent(AsyncAgent):
 
         return context
 
+    # Compiled once per process: one case-insensitive C-level scan per
+    # command instead of lowercasing and substring-searching five times.
+    # The word boundaries also stop "drop" matching inside "dropdown".
+    _DESTRUCTIVE_RE = re.compile(r"\b(rm|delete|drop|truncate|kill)\b", re.IGNORECASE)
+
     def _is_destructive_command(self, command: str) -> bool:
         """Detect if command is destructive"""
-        destructive_patterns = [
-            "rm ",
-            "delete",
-            "drop",
-            "truncate",
-            "kill",
-        ]
-        return any(pattern in command.lower() for pattern in destructive_patterns)
+        return self._DESTRUCTIVE_RE.search(command) is not None
 
     def _execute_tool(
-        self, tool_name: str, tool_args: Dict[str, Any], lease_id: str
+        self,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        lease_id: str,
+        action_str: Optional[str] = None,
     ) -> str:
         """Execute the tool with Ward lease"""
+        if action_str is None:
+            action_str = f"{tool_name}({_json_dumps(tool_args)})"
         try:
             if tool_name == "execute_bash":
                 # ACTUALLY execute the command
@@ -281,7 +473,7 @@ class AsyncDeepSeekAgent(AsyncAgent):
             self.backend.record_action(
                 action_id=str(uuid.uuid4()),
                 agent_id=self.agent_id,
-                action=f"{tool_name}({json.dumps(tool_args)})",
+                action=action_str,
                 lease_id=lease_id,
                 status="success",
                 result={"output": result},
@@ -295,7 +487,7 @@ class AsyncDeepSeekAgent(AsyncAgent):
             self.backend.record_action(
                 action_id=str(uuid.uuid4()),
                 agent_id=self.agent_id,
-                action=f"{tool_name}({json.dumps(tool_args)})",
+                action=action_str,
                 lease_id=lease_id,
                 status="failed",
                 result={"error": error_msg},
@@ -306,7 +498,7 @@ class AsyncDeepSeekAgent(AsyncAgent):
             self.backend.record_action(
                 action_id=str(uuid.uuid4()),
                 agent_id=self.agent_id,
-                action=f"{tool_name}({json.dumps(tool_args)})",
+                action=action_str,
                 lease_id=lease_id,
                 status="failed",
                 result={"error": str(e)},
@@ -336,13 +528,22 @@ class AsyncDeepSeekAgent(AsyncAgent):
             self._demo_workflow()
         else:
             print("Running full DeepSeek conversation loop\n")
-            self._deepseek_conversation()
+            asyncio.run(self._deepseek_conversation())
+
+        # Durability point: make sure queued audit writes hit disk
+        # before the process exits
+        self.backend.flush()
 
-    def _deepseek_conversation(self):
+    @staticmethod
+    async def _ainput(prompt: str = "> ") -> str:
+        """Read console input without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+    async def _deepseek_conversation(self):
         """Run full DeepSeek conversation with async approval handling"""
         # Get user query
         print("Enter your request (or 'demo' for demo workflow):")
-        user_query = input("> ").strip()
+        user_query = (await self._ainput()).strip()
 
         if user_query.lower() == "demo":
             self._demo_workflow()
@@ -369,50 +570,101 @@ class AsyncDeepSeekAgent(AsyncAgent):
         while iteration < max_iterations:
             iteration += 1
 
-            # Call LLM
+            # Call LLM with streaming: content tokens print as they
+            # arrive (time-to-first-token instead of full-response
+            # latency) and tool_call deltas accumulate by index
             model = os.environ.get("LLM_MODEL", "deepseek/deepseek-chat")
             try:
-                response = self.client.chat.completions.create(
+                stream = await self.client.chat.completions.create(
                     model=model,
-                    messages=messages,
+                    messages=self._trim_messages(messages),
                     tools=self.tools,
                     tool_choice="auto",
+                    stream=True,
                 )
+
+                content_parts: List[str] = []
+                tool_calls_acc: Dict[int, Dict[str, Any]] = {}
+                streamed_header = False
+
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+
+                    if delta.content:
+                        if not streamed_header:
+                            print(f"\n{'='*70}")
+                            print("💬 DeepSeek:")
+                            print(f"{'='*70}\n")
+                            streamed_header = True
+                        print(delta.content, end="", flush=True)
+                        content_parts.append(delta.content)
+
+                    for tc in delta.tool_calls or ():
+                        acc = tool_calls_acc.setdefault(
+                            tc.index,
+                            {
+                                "id": None,
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            },
+                        )
+                        if tc.id:
+                            acc["id"] = tc.id
+                        if tc.function:
+                            if tc.function.name:
+                                acc["function"]["name"] += tc.function.name
+                            if tc.function.arguments:
+                                acc["function"]["arguments"] += tc.function.arguments
+
+                if streamed_header:
+                    print(f"\n\n{'='*70}\n")
             except Exception as e:
                 print(f"❌ DeepSeek API error: {e}")
                 break
 
-            assistant_message = response.choices[0].message
+            assistant_content = "".join(content_parts) or None
+            tool_calls = [tool_calls_acc[i] for i in sorted(tool_calls_acc)]
 
             # Check if DeepSeek wants to call tools
-            if assistant_message.tool_calls:
-                # Process each tool call
-                # Convert to dict format for message history
+            if tool_calls:
+                # The accumulated tool_calls are already in the dict
+                # format the message history needs
                 messages.append({
                     "role": "assistant",
-                    "content": assistant_message.content,
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": tc.type,
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            }
-                        }
-                        for tc in assistant_message.tool_calls
-                    ]
+                    "content": assistant_content,
+                    "tool_calls": tool_calls,
                 })
 
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
+                # Models sometimes emit the same tool call twice in one
+                # turn; dedupe on canonical args so the duplicate skips
+                # the whole request/SQL/subprocess cycle. The key is the
+                # canonical JSON itself — hashing tiny strings first
+                # would only add work on top of the dict's own hash.
+                turn_cache: Dict[str, Dict[str, Any]] = {}
+
+                for tool_call in tool_calls:
+                    tool_name = tool_call["function"]["name"]
+                    tool_args = _json_loads(tool_call["function"]["arguments"])
 
                     print(f"\n🔧 DeepSeek wants to call: {tool_name}")
                     print(f"   Args: {tool_args}")
 
-                    # Request authority from Ward
-                    result = self.request_tool_execution(tool_name, tool_args, tool_call.id)
+                    cache_key = (
+                        f"{tool_name}|"
+                        f"{_json_dumps(tool_args, sort_keys=True)}"
+                    )
+                    cached = turn_cache.get(cache_key)
+                    if cached is not None:
+                        print(f"   ♻️  Duplicate call this turn; reusing result")
+                        result = cached
+                    else:
+                        # Request authority from Ward
+                        result = self.request_tool_execution(
+                            tool_name, tool_args, tool_call["id"]
+                        )
+                        turn_cache[cache_key] = result
 
                     # Handle result based on status
                     if result["status"] == "executed":
@@ -433,14 +685,15 @@ class AsyncDeepSeekAgent(AsyncAgent):
                         tool_result = f"❌ Action denied: {result.get('reason', 'Policy violation')}"
                         print(f"   ❌ Denied by policy")
 
-                    # Add tool result to conversation
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": tool_result,
-                        }
-                    )
+                    # Add tool result to conversation and index it for
+                    # the approval-result patch below
+                    tool_msg = {
+                        "role": "tool",
+                        "tool_call_id": tool_call["id"],
+                        "content": tool_result,
+                    }
+                    messages.append(tool_msg)
+                    self._tool_msg_index[tool_call["id"]] = tool_msg
 
                 # Check for pending approvals before continuing
                 if self.pending_approvals:
@@ -456,31 +709,23 @@ class AsyncDeepSeekAgent(AsyncAgent):
 
                     # Quick approve/deny option
                     print("\nApprove all? (y=yes, n=no, w=wait for manual approval)")
-                    choice = input("> ").strip().lower()
+                    choice = (await self._ainput()).strip().lower()
 
                     if choice == 'y':
-                        # Approve all pending
+                        # Approve all pending in one batched write
                         print("\n✅ Approving all pending decisions...")
-                        for dec_id in list(self.pending_approvals.keys()):
-                            subprocess.run([
-                                "python", "-m", "ward.cli.ward",
-                                "--db", "deepseek_async.db",
-                                "approve", dec_id,
-                                "-m", "Approved via interactive prompt"
-                            ], capture_output=True)
+                        self._apply_interactive_outcome(
+                            list(self.pending_approvals.keys()), approve=True
+                        )
                         print("✓ All decisions approved\n")
                         # Let the polling loop handle execution
 
                     elif choice == 'n':
-                        # Deny all pending
+                        # Deny all pending in one batched write
                         print("\n🚫 Denying all pending decisions...")
-                        for dec_id in list(self.pending_approvals.keys()):
-                            subprocess.run([
-                                "python", "-m", "ward.cli.ward",
-                                "--db", "deepseek_async.db",
-                                "deny", dec_id,
-                                "-m", "Denied via interactive prompt"
-                            ], capture_output=True)
+                        self._apply_interactive_outcome(
+                            list(self.pending_approvals.keys()), approve=False
+                        )
                         print("✓ All decisions denied\n")
                         # Let the polling loop handle the denials
 
@@ -493,13 +738,28 @@ class AsyncDeepSeekAgent(AsyncAgent):
                     print(f"\nPolling every {self.poll_interval}s for approvals...")
                     print("(Press Ctrl+C to stop)\n")
 
-                    # Poll for approvals
+                    # Poll for approvals. In-process writers (and the
+                    # CLI when it shares this backend) wake the wait
+                    # immediately; the timeout is the fallback cadence
+                    # for out-of-process writers
                     try:
+                        loop = asyncio.get_running_loop()
+                        # Back off while nothing changes (the update
+                        # signal still wakes the wait early); reset to
+                        # the base cadence whenever work arrives
+                        interval = self.poll_interval
                         while self.pending_approvals:
-                            time.sleep(self.poll_interval)
+                            # The wait blocks a worker thread, not the
+                            # event loop
+                            await loop.run_in_executor(
+                                None,
+                                self.backend.wait_for_update,
+                                interval,
+                            )
                             approved = self.check_pending_approvals()
 
                             if approved:
+                                interval = self.poll_interval
                                 print(f"\n✅ {len(approved)} decision(s) processed!")
 
                                 # Update the conversation with real results
@@ -520,14 +780,14 @@ class AsyncDeepSeekAgent(AsyncAgent):
                                     else:
                                         result_msg = approval['result']
 
-                                    # Find the exact tool message with this tool_call_id
-                                    for msg in messages:
-                                        if (isinstance(msg, dict) and
-                                            msg.get("role") == "tool" and
-                                            msg.get("tool_call_id") == tool_call_id):
-                                            # Update with actual result
-                                            msg["content"] = result_msg
-                                            break
+                                    # O(1) lookup of the tool message;
+                                    # the index holds the same dict
+                                    # object that sits in messages
+                                    msg = self._tool_msg_index.get(tool_call_id)
+                                    if msg is not None:
+                                        msg["content"] = result_msg
+                            else:
+                                interval = min(interval * 2, self.poll_interval * 4)
 
                         print("\n✓ All decisions processed, continuing conversation...\n")
 
@@ -537,15 +797,10 @@ class AsyncDeepSeekAgent(AsyncAgent):
                         break
 
             else:
-                # DeepSeek is responding with text (no tool calls)
-                response_text = assistant_message.content
+                # DeepSeek is responding with text (no tool calls);
+                # the content already streamed to the console above
+                response_text = assistant_content
                 if response_text:
-                    print(f"\n{'='*70}")
-                    print("💬 DeepSeek:")
-                    print(f"{'='*70}")
-                    print(f"\n{response_text}\n")
-                    print(f"{'='*70}\n")
-
                     # Add assistant's response to conversation
                     messages.append({
                         "role": "assistant",
@@ -554,7 +809,7 @@ class AsyncDeepSeekAgent(AsyncAgent):
 
                     # Get user's follow-up input
                     print("Your response (or 'exit' to quit):")
-                    user_input = input("> ").strip()
+                    user_input = (await self._ainput()).strip()
 
                     if user_input.lower() in ['exit', 'quit', 'q']:
                         print("\n👋 Conversation ended.\n")
@@ -618,18 +873,25 @@ class AsyncDeepSeekAgent(AsyncAgent):
             print(f"\nPolling for approvals every {self.poll_interval}s...")
             print("(Press Ctrl+C to stop)\n")
 
-            # Poll for approvals
+            # Poll for approvals, sleeping on the backend's update
+            # signal instead of a fixed cadence
             try:
+                # Idle waits back off toward 4x the base cadence; the
+                # update signal still cuts any wait short
+                interval = self.poll_interval
                 while self.pending_approvals:
-                    time.sleep(self.poll_interval)
+                    self.backend.wait_for_update(timeout=interval)
                     results = self.check_pending_approvals()
 
                     if results:
+                        interval = self.poll_interval
                         print(
                             f"\n✅ {len(results)} approvals processed!"
                         )
                         for r in results:
                             print(f"   - {r['tool_name']}: {r['result'][:50]}...")
+                    else:
+                        interval = min(interval * 2, self.poll_interval * 4)
 
                 print("\n✓ All approvals processed!")
 
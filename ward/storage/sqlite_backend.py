@@ -9,10 +9,23 @@ Schema follows v1 spec exactly:
 
 import sqlite3
 import json
+import queue
+import sys
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from pathlib import Path
 
+# Audit rows carry JSON blobs (context, result, tags, DIR payloads);
+# orjson parses them several times faster than stdlib json when
+# installed (pip install ward[fast-json])
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class SQLiteAuditBackend:
     """
@@ -21,21 +34,81 @@ class SQLiteAuditBackend:
     Stores decisions, actions, and revocations with no schema evolution.
     """
 
-    def __init__(self, db_path: str = "ward.db"):
+    # Rows queued per flush when batch_writes is enabled
+    MAX_WRITE_BATCH = 128
+
+    def __init__(self, db_path: str = "ward.db", batch_writes: bool = False):
         """
         Initialize SQLite backend.
 
         Args:
             db_path: Path to SQLite database file
+            batch_writes: If True, record_decision/record_action/
+                         record_revocation enqueue rows for a background
+                         writer that flushes them in batches with one
+                         commit each, instead of one INSERT+COMMIT per
+                         call. Reads flush pending writes first, so
+                         read-your-writes still holds. Call flush() at
+                         durability points.
         """
         self.db_path = db_path
+        self.batch_writes = batch_writes
+        # Wakes pollers blocked in wait_for_update when a decision,
+        # approval, or revocation is written
+        self._wake = threading.Condition()
+        # Long-lived read connection for poll_decisions, plus cached SQL
+        # text keyed by ID-list size. Reusing the connection and the
+        # exact SQL string lets sqlite3's per-connection statement cache
+        # skip re-parsing the query on every poll tick.
+        self._poll_lock = threading.Lock()
+        self._poll_conn: Optional[sqlite3.Connection] = None
+        self._poll_sql_cache: Dict[int, str] = {}
         self._init_schema()
 
+        # Write-behind queue of (sql, params) rows drained by a daemon
+        # thread; amortizes commits across many records
+        self._write_queue: Optional[queue.Queue] = None
+        # Rows the background writer could not commit even one at a
+        # time, kept as (sql, params, exception) so failures are
+        # inspectable instead of silently dropped
+        self.write_errors: List[tuple] = []
+        if batch_writes:
+            self._write_queue = queue.Queue()
+            writer = threading.Thread(
+                target=self._write_loop, daemon=True, name="ward-audit-writer"
+            )
+            writer.start()
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open a connection with the backend's tuned pragmas.
+
+        journal_mode=WAL is set once at schema init (it persists in the
+        database file); the remaining pragmas are per-connection:
+        synchronous=NORMAL drops the per-statement fsync to
+        per-checkpoint (safe under WAL), busy_timeout retries briefly
+        instead of surfacing SQLITE_BUSY when the CLI and an agent
+        write concurrently, and temp_store/cache_size/mmap_size keep
+        sorts and hot pages in memory.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
     def _init_schema(self) -> None:
         """Create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
+        # WAL survives in the file, so one statement here covers every
+        # later connection; readers stop blocking writers and commits
+        # group-batch into the log
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # Decisions table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS decisions (
@@ -119,6 +192,25 @@ class SQLiteAuditBackend:
         except sqlite3.OperationalError:
             pass  # Column already exists
 
+        # Terminal-state view: folds denial/approval/revocation into one
+        # status column so pollers issue a single set-oriented query
+        # instead of branching across three lookups in Python
+        cursor.execute("""
+            CREATE VIEW IF NOT EXISTS v_decision_status AS
+            SELECT d.id AS decision_id,
+                   CASE
+                       WHEN d.outcome = 'denied' THEN 'denied'
+                       WHEN EXISTS(
+                           SELECT 1 FROM revocations r
+                           WHERE r.lease_id = d.lease_id
+                       ) THEN 'revoked'
+                       WHEN d.outcome = 'approved' THEN 'approved'
+                       ELSE 'pending'
+                   END AS status,
+                   d.lease_id AS lease_id
+            FROM decisions d
+        """)
+
         # Indexes for common queries
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_decisions_agent ON decisions(agent_id)"
@@ -135,17 +227,137 @@ class SQLiteAuditBackend:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_revocations_lease ON revocations(lease_id)"
         )
+        # Partial index: list_active_leases only ever joins approval
+        # actions, so indexing just those rows keeps it small
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_actions_approve ON actions(action) "
+            "WHERE action = 'approve_decision'"
+        )
+        # Partial covering index for active-lease lookups: only approved
+        # decisions that actually carry a lease qualify
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dec_outcome_lease "
+            "ON decisions(outcome, lease_id) "
+            "WHERE outcome = 'approved' AND lease_id IS NOT NULL"
+        )
+        # Partial index over the pending queue, which stays tiny relative
+        # to the full decision log
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dec_pending ON decisions(outcome) "
+            "WHERE outcome = 'needs_human'"
+        )
+        # Agents on the hot path ask for their newest decision with a
+        # given outcome; this turns that ORDER BY ... LIMIT 1 into a
+        # single B-tree seek instead of a scan over the agent's history
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_decisions_agent_outcome_ts "
+            "ON decisions(agent_id, outcome, timestamp DESC)"
+        )
 
         conn.commit()
         conn.close()
 
-    def _serialize_list(self, items: List[str]) -> str:
-        """Serialize list to JSON string"""
+    def _write_loop(self) -> None:
+        """Drain queued audit rows and flush them batch-at-a-time"""
+        while True:
+            batch = [self._write_queue.get()]
+
+            # Pick up whatever else is already queued, up to the cap
+            try:
+                while len(batch) < self.MAX_WRITE_BATCH:
+                    batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                self._flush_batch(batch)
+            except Exception:
+                # The writer must outlive a bad row: readers join() this
+                # queue, so a dead writer turns every read into a hang.
+                # Retry row-at-a-time so one poison row doesn't drop the
+                # whole batch; rows that still fail land on write_errors.
+                self._salvage_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+            self._notify_waiters()
+
+    def _flush_batch(self, batch: List[tuple]) -> None:
+        """Write a batch of (sql, params) rows under a single commit"""
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # Group identical statements so each runs as one executemany
+        groups: Dict[str, List[tuple]] = {}
+        for sql, params in batch:
+            groups.setdefault(sql, []).append(params)
+
+        try:
+            for sql, rows in groups.items():
+                cursor.executemany(sql, rows)
+            conn.commit()
+        except Exception:
+            # Release the write lock before the caller's row-by-row
+            # salvage pass reopens a connection
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _salvage_batch(self, batch: List[tuple]) -> None:
+        """Re-run a failed batch row-by-row, keeping rows that still fail"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        for sql, params in batch:
+            try:
+                cursor.execute(sql, params)
+                conn.commit()
+            except Exception as exc:
+                conn.rollback()
+                self.write_errors.append((sql, params, exc))
+                print(f"ward: audit write failed: {exc}", file=sys.stderr)
+        conn.close()
+
+    def _enqueue_write(self, sql: str, params: tuple) -> None:
+        """Queue a row for the background writer"""
+        self._write_queue.put((sql, params))
+
+    def flush(self) -> None:
+        """
+        Block until all queued audit writes are committed.
+
+        No-op when batch_writes is disabled.
+        """
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def _notify_waiters(self) -> None:
+        """Wake any pollers blocked in wait_for_update"""
+        with self._wake:
+            self._wake.notify_all()
+
+    def wait_for_update(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until a decision/approval/revocation is written, or timeout.
+
+        Lets pollers sleep until something actually changed instead of
+        waking on a fixed cadence. Spurious wakeups are possible; callers
+        should re-check state after waking.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        """
+        with self._wake:
+            self._wake.wait(timeout=timeout)
+
+    def _serialize_list(self, items: Sequence[str]) -> str:
+        """Serialize a sequence of strings to a JSON array"""
         return json.dumps(items) if items else "[]"
 
     def _deserialize_list(self, data: str) -> List[str]:
         """Deserialize JSON string to list"""
-        return json.loads(data) if data else []
+        return _loads(data) if data else []
 
     def record_decision(
         self,
@@ -162,34 +374,36 @@ class SQLiteAuditBackend:
         timestamp: Optional[datetime] = None,
     ) -> None:
         """Record an authority decision"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
+        sql = """
             INSERT INTO decisions (
                 id, agent_id, action, outcome, reason,
                 known_unknowns, context, policy_name, rule_name,
                 lease_id, timestamp
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                decision_id,
-                agent_id,
-                action,
-                outcome,
-                reason,
-                self._serialize_list(known_unknowns or []),
-                json.dumps(context) if context else "{}",
-                policy_name,
-                rule_name,
-                lease_id,
-                (timestamp or datetime.now()).isoformat(),
-            ),
+        """
+        params = (
+            decision_id,
+            agent_id,
+            action,
+            outcome,
+            reason,
+            self._serialize_list(known_unknowns or []),
+            json.dumps(context) if context else "{}",
+            policy_name,
+            rule_name,
+            lease_id,
+            (timestamp or datetime.now()).isoformat(),
         )
 
+        if self.batch_writes:
+            self._enqueue_write(sql, params)
+            return
+
+        conn = self._connect()
+        conn.execute(sql, params)
         conn.commit()
         conn.close()
+        self._notify_waiters()
 
     def record_action(
         self,
@@ -200,33 +414,34 @@ class SQLiteAuditBackend:
         lease_id: Optional[str] = None,
         result: Optional[Dict[str, Any]] = None,
         context: Optional[Dict[str, Any]] = None,
-        tags: Optional[List[str]] = None,
+        tags: Optional[Sequence[str]] = None,
         timestamp: Optional[datetime] = None,
     ) -> None:
         """Record an executed action"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
+        sql = """
             INSERT INTO actions (
                 id, agent_id, action, lease_id, status,
                 result, context, tags, timestamp
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                action_id,
-                agent_id,
-                action,
-                lease_id,
-                status,
-                json.dumps(result) if result else "{}",
-                json.dumps(context) if context else "{}",
-                self._serialize_list(tags or []),
-                (timestamp or datetime.now()).isoformat(),
-            ),
+        """
+        params = (
+            action_id,
+            agent_id,
+            action,
+            lease_id,
+            status,
+            json.dumps(result) if result else "{}",
+            json.dumps(context) if context else "{}",
+            self._serialize_list(tags or []),
+            (timestamp or datetime.now()).isoformat(),
         )
 
+        if self.batch_writes:
+            self._enqueue_write(sql, params)
+            return
+
+        conn = self._connect()
+        conn.execute(sql, params)
         conn.commit()
         conn.close()
 
@@ -242,30 +457,32 @@ class SQLiteAuditBackend:
         timestamp: Optional[datetime] = None,
     ) -> None:
         """Record a lease revocation"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
+        sql = """
             INSERT INTO revocations (
                 id, lease_id, agent_id, reason, revoked_by,
                 description, violations, timestamp
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                revocation_id,
-                lease_id,
-                agent_id,
-                reason,
-                revoked_by,
-                description,
-                self._serialize_list(violations or []),
-                (timestamp or datetime.now()).isoformat(),
-            ),
+        """
+        params = (
+            revocation_id,
+            lease_id,
+            agent_id,
+            reason,
+            revoked_by,
+            description,
+            self._serialize_list(violations or []),
+            (timestamp or datetime.now()).isoformat(),
         )
 
+        if self.batch_writes:
+            self._enqueue_write(sql, params)
+            return
+
+        conn = self._connect()
+        conn.execute(sql, params)
         conn.commit()
         conn.close()
+        self._notify_waiters()
 
     def update_decision(
         self,
@@ -274,7 +491,8 @@ class SQLiteAuditBackend:
         lease_id: Optional[str] = None,
     ) -> None:
         """Update a decision's outcome and/or lease_id"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
 
         updates = []
@@ -298,6 +516,7 @@ class SQLiteAuditBackend:
         cursor.execute(query, params)
         conn.commit()
         conn.close()
+        self._notify_waiters()
 
     def get_decisions(
         self,
@@ -306,7 +525,8 @@ class SQLiteAuditBackend:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """Query decisions"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -336,7 +556,7 @@ class SQLiteAuditBackend:
                 "outcome": row["outcome"],
                 "reason": row["reason"],
                 "known_unknowns": self._deserialize_list(row["known_unknowns"]),
-                "context": json.loads(row["context"]) if row["context"] else {},
+                "context": _loads(row["context"]) if row["context"] else {},
                 "policy_name": row["policy_name"],
                 "rule_name": row["rule_name"],
                 "lease_id": row["lease_id"],
@@ -345,6 +565,107 @@ class SQLiteAuditBackend:
             for row in rows
         ]
 
+    def get_decision(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single decision by ID.
+
+        One indexed WHERE id = ? lookup; avoids materializing the whole
+        decisions table just to scan for one row.
+        """
+        self.flush()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT * FROM decisions WHERE id = ?", (decision_id,))
+        row = cursor.fetchone()
+        conn.close()
+
+        if not row:
+            return None
+        return self._decision_row_to_dict(row)
+
+    def get_decisions_by_ids(
+        self, decision_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch many decisions by ID in a single query.
+
+        One IN (...) lookup replaces a round-trip per decision when a
+        poller resolves its whole pending set at once. Results come back
+        in the order requested; unknown IDs are skipped.
+
+        Args:
+            decision_ids: Decision IDs to look up
+        """
+        if not decision_ids:
+            return []
+
+        self.flush()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        by_id = {}
+        # Chunk to stay under SQLite's host-parameter limit
+        for start in range(0, len(decision_ids), 500):
+            chunk = decision_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT * FROM decisions WHERE id IN ({placeholders})", chunk
+            )
+            for row in cursor.fetchall():
+                by_id[row["id"]] = self._decision_row_to_dict(row)
+        conn.close()
+
+        return [by_id[did] for did in decision_ids if did in by_id]
+
+    def get_pending_decision(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single decision by ID if it is still awaiting a human.
+
+        Same pending criteria as get_pending_approvals (needs_human and
+        not yet processed), but resolved with one indexed lookup.
+        """
+        self.flush()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT d.*
+            FROM decisions d
+            LEFT JOIN human_approvals ha ON d.id = ha.decision_id
+            WHERE d.id = ?
+              AND d.outcome = 'needs_human'
+              AND ha.id IS NULL
+            """,
+            (decision_id,),
+        )
+        row = cursor.fetchone()
+        conn.close()
+
+        if not row:
+            return None
+        return self._decision_row_to_dict(row)
+
+    def _decision_row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a decisions row to the dict shape queries return"""
+        return {
+            "id": row["id"],
+            "agent_id": row["agent_id"],
+            "action": row["action"],
+            "outcome": row["outcome"],
+            "reason": row["reason"],
+            "known_unknowns": self._deserialize_list(row["known_unknowns"]),
+            "context": _loads(row["context"]) if row["context"] else {},
+            "policy_name": row["policy_name"],
+            "rule_name": row["rule_name"],
+            "lease_id": row["lease_id"],
+            "timestamp": row["timestamp"],
+        }
+
     def get_actions(
         self,
         agent_id: Optional[str] = None,
@@ -353,7 +674,8 @@ class SQLiteAuditBackend:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """Query actions"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -386,8 +708,8 @@ class SQLiteAuditBackend:
                 "action": row["action"],
                 "lease_id": row["lease_id"],
                 "status": row["status"],
-                "result": json.loads(row["result"]) if row["result"] else {},
-                "context": json.loads(row["context"]) if row["context"] else {},
+                "result": _loads(row["result"]) if row["result"] else {},
+                "context": _loads(row["context"]) if row["context"] else {},
                 "tags": self._deserialize_list(row["tags"]),
                 "timestamp": row["timestamp"],
             }
@@ -401,7 +723,8 @@ class SQLiteAuditBackend:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """Query revocations"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -437,15 +760,80 @@ class SQLiteAuditBackend:
             for row in rows
         ]
 
-    def get_pending_approvals(self) -> List[Dict[str, Any]]:
+    def get_revocations_since(
+        self, iso_timestamp: str, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Query revocations recorded at or after a point in time.
+
+        The cutoff is compared as TEXT — ISO-8601 timestamps sort
+        lexicographically — so the filter runs in SQL instead of
+        fromisoformat-parsing every row in Python.
+
+        Args:
+            iso_timestamp: Inclusive ISO-8601 lower bound
+            limit: Maximum rows to return
+        """
+        self.flush()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT * FROM revocations
+            WHERE timestamp >= ?
+            ORDER BY timestamp DESC LIMIT ?
+            """,
+            (iso_timestamp, limit),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                "id": row["id"],
+                "lease_id": row["lease_id"],
+                "agent_id": row["agent_id"],
+                "reason": row["reason"],
+                "revoked_by": row["revoked_by"],
+                "description": row["description"],
+                "violations": self._deserialize_list(row["violations"]),
+                "timestamp": row["timestamp"],
+            }
+            for row in rows
+        ]
+
+    def count_active_leases(self) -> int:
+        """Count approved decisions that carry a lease"""
+        self.flush()
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM decisions "
+            "WHERE outcome = 'approved' AND lease_id IS NOT NULL"
+        )
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    def get_pending_approvals(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Get decisions that need human approval.
 
         Only returns decisions that:
         - Have outcome = 'needs_human'
         - Have NOT been approved/denied yet (no entry in human_approvals)
+
+        Args:
+            limit: Maximum rows to return (keeps the materialized page
+                  bounded even on huge audit logs)
+            offset: Rows to skip, for pagination
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -458,7 +846,9 @@ class SQLiteAuditBackend:
             WHERE d.outcome = 'needs_human'
               AND ha.id IS NULL
             ORDER BY d.timestamp DESC
-        """
+            LIMIT ? OFFSET ?
+        """,
+            (limit, offset),
         )
         rows = cursor.fetchall()
         conn.close()
@@ -471,7 +861,7 @@ class SQLiteAuditBackend:
                 "outcome": row["outcome"],
                 "reason": row["reason"],
                 "known_unknowns": self._deserialize_list(row["known_unknowns"]),
-                "context": json.loads(row["context"]) if row["context"] else {},
+                "context": _loads(row["context"]) if row["context"] else {},
                 "policy_name": row["policy_name"],
                 "rule_name": row["rule_name"],
                 "lease_id": row["lease_id"],
@@ -480,9 +870,86 @@ class SQLiteAuditBackend:
             for row in rows
         ]
 
+    def list_active_leases(self, now_iso: str) -> List[Dict[str, Any]]:
+        """
+        List unrevoked, unexpired leases with their approval constraints.
+
+        One SQL query joins approved decisions against their approval
+        actions (json_extract pulls max_steps/expires_at out of the
+        stored result blob) and anti-joins revocations, replacing three
+        separate queries plus a Python-side JSON parse per action. ISO
+        timestamps compare lexicographically, so expiry filters as TEXT.
+
+        Args:
+            now_iso: Current time as an ISO-8601 string
+
+        Returns:
+            List of lease dicts; max_steps/expires_at are None when no
+            approval action recorded them
+        """
+        self.flush()
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT d.lease_id,
+                   d.agent_id,
+                   d.action,
+                   d.id AS decision_id,
+                   json_extract(a.result, '$.max_steps') AS max_steps,
+                   json_extract(a.result, '$.expires_at') AS expires_at
+            FROM decisions d
+            LEFT JOIN actions a
+                ON a.action = 'approve_decision'
+               AND a.status = 'approved'
+               AND json_extract(a.result, '$.lease_id') = d.lease_id
+            LEFT JOIN revocations r ON r.lease_id = d.lease_id
+            WHERE d.outcome = 'approved'
+              AND d.lease_id IS NOT NULL
+              AND r.lease_id IS NULL
+              AND (expires_at IS NULL OR expires_at > ?)
+            ORDER BY d.timestamp DESC
+            """,
+            (now_iso,),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                "lease_id": row[0],
+                "agent_id": row[1],
+                "action": row[2],
+                "decision_id": row[3],
+                "max_steps": row[4],
+                "expires_at": row[5],
+            }
+            for row in rows
+        ]
+
+    def count_pending_approvals(self) -> int:
+        """Count decisions awaiting human approval"""
+        self.flush()
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT COUNT(*)
+            FROM decisions d
+            LEFT JOIN human_approvals ha ON d.id = ha.decision_id
+            WHERE d.outcome = 'needs_human'
+              AND ha.id IS NULL
+            """
+        )
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
     def count_decisions(self) -> int:
         """Get total decision count"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM decisions")
         count = cursor.fetchone()[0]
@@ -491,7 +958,8 @@ class SQLiteAuditBackend:
 
     def count_actions(self) -> int:
         """Get total action count"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM actions")
         count = cursor.fetchone()[0]
@@ -500,7 +968,8 @@ class SQLiteAuditBackend:
 
     def count_revocations(self) -> int:
         """Get total revocation count"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM revocations")
         count = cursor.fetchone()[0]
@@ -516,7 +985,8 @@ class SQLiteAuditBackend:
         model: Optional[str] = None,
     ) -> None:
         """Store a Decision Intelligence Report"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -539,7 +1009,8 @@ class SQLiteAuditBackend:
 
     def get_decision_intel(self, decision_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve Decision Intelligence Report for a decision"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -554,12 +1025,59 @@ class SQLiteAuditBackend:
 
         return {
             "decision_id": row["decision_id"],
-            "payload": json.loads(row["payload_json"]),
+            "payload": _loads(row["payload_json"]),
             "generated_at": row["generated_at"],
             "generator": row["generator"],
             "model": row["model"],
         }
 
+    def get_decision_intel_many(
+        self, decision_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve Decision Intelligence Reports for many decisions at once.
+
+        One IN (...) query replaces the N+1 pattern of calling
+        get_decision_intel per decision when listing pending approvals.
+
+        Args:
+            decision_ids: Decision IDs to look up
+
+        Returns:
+            Dict mapping decision_id -> report dict (same shape as
+            get_decision_intel); decisions without a DIR are absent
+        """
+        if not decision_ids:
+            return {}
+
+        self.flush()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        rows = []
+        # Chunk to stay under SQLite's host-parameter limit
+        for start in range(0, len(decision_ids), 500):
+            chunk = decision_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT * FROM decision_intel WHERE decision_id IN ({placeholders})",
+                chunk,
+            )
+            rows.extend(cursor.fetchall())
+        conn.close()
+
+        return {
+            row["decision_id"]: {
+                "decision_id": row["decision_id"],
+                "payload": _loads(row["payload_json"]),
+                "generated_at": row["generated_at"],
+                "generator": row["generator"],
+                "model": row["model"],
+            }
+            for row in rows
+        }
+
     def record_human_approval(
         self,
         approval_id: str,
@@ -590,20 +1108,17 @@ class SQLiteAuditBackend:
             rationale: Human's explanation for their decision
             timestamp: When approval happened
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Determine if constraints were modified
-        constraints_modified = 0
-        if recommended_max_steps is not None and actual_max_steps is not None:
-            if recommended_max_steps != actual_max_steps:
-                constraints_modified = 1
-        if (
-            recommended_duration_minutes is not None
-            and actual_duration_minutes is not None
-        ):
-            if recommended_duration_minutes != actual_duration_minutes:
-                constraints_modified = 1
+        constraints_modified = self._constraints_modified(
+            recommended_max_steps,
+            actual_max_steps,
+            recommended_duration_minutes,
+            actual_duration_minutes,
+        )
 
         cursor.execute(
             """
@@ -631,12 +1146,196 @@ class SQLiteAuditBackend:
 
         conn.commit()
         conn.close()
+        self._notify_waiters()
+
+    def apply_human_decisions(
+        self,
+        decision_updates: List[tuple],
+        actions: List[Dict[str, Any]],
+        approvals: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Apply a batch of human approve/deny outcomes in one transaction.
+
+        Batch approval of N decisions used to issue 3N separate
+        commits (update_decision, record_action, record_human_approval
+        per decision); this folds them into three executemany calls
+        under a single commit, so the whole batch costs one fsync.
+
+        Args:
+            decision_updates: (outcome, lease_id, decision_id) tuples;
+                             lease_id None leaves the existing value
+            actions: Keyword dicts matching record_action's signature
+            approvals: Keyword dicts matching record_human_approval's
+                      signature
+        """
+        self.flush()
+        conn = self._connect()
+        cursor = conn.cursor()
+        now_iso = datetime.now().isoformat()
+
+        if decision_updates:
+            cursor.executemany(
+                "UPDATE decisions SET outcome = ?, "
+                "lease_id = COALESCE(?, lease_id) WHERE id = ?",
+                decision_updates,
+            )
+
+        if actions:
+            self._insert_actions_multirow(cursor, actions, now_iso)
+
+        if approvals:
+            self._insert_human_approvals_multirow(cursor, approvals, now_iso)
+
+        conn.commit()
+        conn.close()
+        self._notify_waiters()
+
+    # 999 is SQLite's default host-parameter limit; chunk multi-row
+    # VALUES inserts so each statement stays under it
+    _MAX_HOST_PARAMS = 999
+
+    def record_actions_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Record many actions with multi-row VALUES inserts.
+
+        One statement per chunk instead of one prepare/bind/step cycle
+        per row; a 100-event burst becomes a single INSERT.
+
+        Args:
+            rows: Keyword dicts matching record_action's signature
+        """
+        if not rows:
+            return
+
+        self.flush()
+        conn = self._connect()
+        self._insert_actions_multirow(
+            conn.cursor(), rows, datetime.now().isoformat()
+        )
+        conn.commit()
+        conn.close()
+
+    def record_human_approvals_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Record many human approvals with multi-row VALUES inserts.
+
+        Args:
+            rows: Keyword dicts matching record_human_approval's
+                 signature
+        """
+        if not rows:
+            return
+
+        self.flush()
+        conn = self._connect()
+        self._insert_human_approvals_multirow(
+            conn.cursor(), rows, datetime.now().isoformat()
+        )
+        conn.commit()
+        conn.close()
+        self._notify_waiters()
+
+    def _insert_actions_multirow(
+        self, cursor: sqlite3.Cursor, actions: List[Dict[str, Any]], now_iso: str
+    ) -> None:
+        """Insert action rows as chunked multi-row VALUES statements"""
+        cols = 9
+        rows_per_stmt = self._MAX_HOST_PARAMS // cols
+        row_sql = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+        for start in range(0, len(actions), rows_per_stmt):
+            chunk = actions[start : start + rows_per_stmt]
+            params = []
+            for a in chunk:
+                params.extend(
+                    (
+                        a["action_id"],
+                        a["agent_id"],
+                        a["action"],
+                        a.get("lease_id"),
+                        a["status"],
+                        json.dumps(a.get("result")) if a.get("result") else "{}",
+                        json.dumps(a.get("context")) if a.get("context") else "{}",
+                        self._serialize_list(a.get("tags") or []),
+                        a.get("timestamp") or now_iso,
+                    )
+                )
+            cursor.execute(
+                "INSERT INTO actions ("
+                "id, agent_id, action, lease_id, status, "
+                "result, context, tags, timestamp"
+                ") VALUES " + ",".join([row_sql] * len(chunk)),
+                params,
+            )
+
+    def _insert_human_approvals_multirow(
+        self, cursor: sqlite3.Cursor, approvals: List[Dict[str, Any]], now_iso: str
+    ) -> None:
+        """Insert approval rows as chunked multi-row VALUES statements"""
+        cols = 12
+        rows_per_stmt = self._MAX_HOST_PARAMS // cols
+        row_sql = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+        for start in range(0, len(approvals), rows_per_stmt):
+            chunk = approvals[start : start + rows_per_stmt]
+            params = []
+            for ha in chunk:
+                params.extend(
+                    (
+                        ha["approval_id"],
+                        ha["decision_id"],
+                        ha["human_outcome"],
+                        ha.get("recommended_max_steps"),
+                        ha.get("actual_max_steps"),
+                        ha.get("recommended_duration_minutes"),
+                        ha.get("actual_duration_minutes"),
+                        self._constraints_modified(
+                            ha.get("recommended_max_steps"),
+                            ha.get("actual_max_steps"),
+                            ha.get("recommended_duration_minutes"),
+                            ha.get("actual_duration_minutes"),
+                        ),
+                        self._serialize_list(ha.get("missing_info_questions") or []),
+                        self._serialize_list(ha.get("missing_info_resolved") or []),
+                        ha.get("rationale"),
+                        ha.get("timestamp") or now_iso,
+                    )
+                )
+            cursor.execute(
+                "INSERT INTO human_approvals "
+                "(id, decision_id, human_outcome, recommended_max_steps, actual_max_steps, "
+                "recommended_duration_minutes, actual_duration_minutes, constraints_modified, "
+                "missing_info_questions, missing_info_resolved, rationale, timestamp) "
+                "VALUES " + ",".join([row_sql] * len(chunk)),
+                params,
+            )
+
+    @staticmethod
+    def _constraints_modified(
+        recommended_max_steps: Optional[int],
+        actual_max_steps: Optional[int],
+        recommended_duration_minutes: Optional[int],
+        actual_duration_minutes: Optional[int],
+    ) -> int:
+        """1 if the human overrode any recommended constraint, else 0"""
+        if recommended_max_steps is not None and actual_max_steps is not None:
+            if recommended_max_steps != actual_max_steps:
+                return 1
+        if (
+            recommended_duration_minutes is not None
+            and actual_duration_minutes is not None
+        ):
+            if recommended_duration_minutes != actual_duration_minutes:
+                return 1
+        return 0
 
     def get_human_approvals(
         self, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get all human approvals"""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -664,7 +1363,7 @@ class SQLiteAuditBackend:
                 "missing_info_resolved": self._deserialize_list(
                     row["missing_info_resolved"]
                 ),
-                "rationale": row.get("rationale"),  # Human's explanation
+                "rationale": row["rationale"],  # Human's explanation
                 "timestamp": row["timestamp"],
             }
             for row in rows
@@ -676,12 +1375,28 @@ class SQLiteAuditBackend:
 
         Returns metrics showing if humans are repeating themselves.
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
 
-        # Total human decisions
-        cursor.execute("SELECT COUNT(*) FROM human_approvals")
-        total_decisions = cursor.fetchone()[0]
+        # One aggregate pass over the table computes all four scalars;
+        # SQLite evaluates the CASE predicates in C, and the table is
+        # scanned once instead of three times
+        cursor.execute("""
+            SELECT
+                COUNT(*) as total,
+                COUNT(CASE WHEN constraints_modified = 0 THEN 1 END) as constraints_accepted,
+                COUNT(CASE WHEN missing_info_questions != '[]' THEN 1 END) as had_questions,
+                COUNT(CASE WHEN missing_info_questions != '[]' AND missing_info_resolved != '[]' THEN 1 END) as resolved_questions
+            FROM human_approvals
+        """)
+        (
+            total_decisions,
+            constraints_accepted,
+            had_questions,
+            resolved_questions,
+        ) = cursor.fetchone()
+        conn.close()
 
         if total_decisions == 0:
             return {
@@ -696,20 +1411,9 @@ class SQLiteAuditBackend:
             }
 
         # Constraint acceptance (did human use recommendations?)
-        cursor.execute(
-            "SELECT COUNT(*) FROM human_approvals WHERE constraints_modified = 0"
-        )
-        constraints_accepted = cursor.fetchone()[0]
         constraints_acceptance_rate = constraints_accepted / total_decisions
 
         # Missing info resolution (did human answer questions?)
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN missing_info_questions != '[]' THEN 1 END) as had_questions,
-                COUNT(CASE WHEN missing_info_questions != '[]' AND missing_info_resolved != '[]' THEN 1 END) as resolved_questions
-            FROM human_approvals
-        """)
-        had_questions, resolved_questions = cursor.fetchone()
         missing_info_resolution_rate = (
             resolved_questions / had_questions if had_questions > 0 else 1.0
         )
@@ -717,8 +1421,6 @@ class SQLiteAuditBackend:
         # Decision repeatability (simplified: constraints accepted + info resolved)
         saturation_score = (constraints_acceptance_rate + missing_info_resolution_rate) / 2
 
-        conn.close()
-
         # LLM readiness check: ≥80% saturation + ≥200 decisions
         ready_for_llm = saturation_score >= 0.8 and total_decisions >= 200
 
@@ -743,7 +1445,8 @@ class SQLiteAuditBackend:
         Returns:
             lease_id if approved, None if still pending or denied
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -768,7 +1471,8 @@ class SQLiteAuditBackend:
         Returns:
             True if denied, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -784,6 +1488,52 @@ class SQLiteAuditBackend:
 
         return row["outcome"] == "denied" if row else False
 
+    def poll_decisions(
+        self, decision_ids: List[str]
+    ) -> Dict[str, tuple]:
+        """
+        Fetch approval status for many decisions in a single query.
+
+        Selects from the v_decision_status view, which folds what would
+        otherwise be three round-trips per decision (is_decision_denied,
+        check_decision_approved, is_lease_revoked) into one status
+        column. Only decisions whose state can resolve a pending
+        approval are returned; still-pending decisions never reach
+        Python.
+
+        Args:
+            decision_ids: Decision IDs to look up
+
+        Returns:
+            Dict mapping decision_id -> (status, lease_id), where status
+            is 'denied', 'revoked', or 'approved'
+        """
+        if not decision_ids:
+            return {}
+
+        self.flush()
+
+        with self._poll_lock:
+            if self._poll_conn is None:
+                self._poll_conn = self._connect(check_same_thread=False)
+
+            sql = self._poll_sql_cache.get(len(decision_ids))
+            if sql is None:
+                placeholders = ",".join("?" * len(decision_ids))
+                sql = f"""
+                    SELECT decision_id, status, lease_id
+                    FROM v_decision_status
+                    WHERE decision_id IN ({placeholders})
+                      AND status != 'pending'
+                """
+                # Keep common batch sizes; unusual sizes just re-parse
+                if len(self._poll_sql_cache) < 64:
+                    self._poll_sql_cache[len(decision_ids)] = sql
+
+            rows = self._poll_conn.execute(sql, list(decision_ids)).fetchall()
+
+        return {row[0]: (row[1], row[2]) for row in rows}
+
     def is_lease_revoked(self, lease_id: str) -> bool:
         """
         Check if a lease has been revoked.
@@ -791,7 +1541,8 @@ class SQLiteAuditBackend:
         Returns:
             True if revoked, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
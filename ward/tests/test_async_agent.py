@@ -0,0 +1,269 @@
+"""
+Tests for the async approval queue
+"""
+
+import asyncio
+import pytest
+import tempfile
+import threading
+import os
+
+from ward.agent import ApprovalPoller, AsyncAgent
+from ward.storage import SQLiteAuditBackend
+
+
+class TestAsyncAgent:
+    """Tests for AsyncAgent pending-approval handling"""
+
+    @pytest.fixture
+    def backend(self):
+        """Create backend with temp database"""
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        yield SQLiteAuditBackend(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @pytest.fixture
+    def agent(self, backend):
+        """Create async agent"""
+        return AsyncAgent(agent_id="agent-1", backend=backend, poll_interval=1)
+
+    def test_add_and_count(self, agent):
+        """Queued approvals are tracked"""
+        agent.add_pending_approval("dec-1", "deploy", {"env": "prod"})
+        agent.add_pending_approval("dec-2", "restart", {"service": "api"})
+
+        assert agent.has_pending_approvals()
+        assert agent.get_pending_count() == 2
+
+        pending = agent.get_pending_decisions()
+        assert {p.decision_id for p in pending} == {"dec-1", "dec-2"}
+
+        view = agent.pending_approvals
+        assert view["dec-1"].action_name == "deploy"
+        assert view["dec-2"].action_args == {"service": "api"}
+
+    def test_approved_decision_executes(self, agent, backend):
+        """Approved decisions run the callback and leave the queue"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-1",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {"env": "prod"})
+
+        executed = []
+
+        def callback(action_name, action_args, lease_id):
+            executed.append((action_name, lease_id))
+            return "done"
+
+        results = agent.check_pending_approvals(callback)
+
+        assert executed == [("deploy", "lease-1")]
+        assert len(results) == 1
+        assert results[0]["status"] == "executed"
+        assert results[0]["result"] == "done"
+        assert not agent.has_pending_approvals()
+
+    def test_denied_decision_removed(self, agent, backend):
+        """Denied decisions are reported without executing"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="denied",
+            reason="No",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {})
+
+        results = agent.check_pending_approvals(lambda *a: pytest.fail("executed"))
+
+        assert len(results) == 1
+        assert results[0]["status"] == "denied"
+        assert agent.get_pending_count() == 0
+
+    def test_revoked_lease_blocks_execution(self, agent, backend):
+        """Approved-then-revoked decisions do not execute"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-1",
+        )
+        backend.record_revocation(
+            revocation_id="rev-1",
+            lease_id="lease-1",
+            agent_id="agent-1",
+            reason="human_override",
+            revoked_by="human",
+            description="Revoked",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {})
+
+        results = agent.check_pending_approvals(lambda *a: pytest.fail("executed"))
+
+        assert results[0]["status"] == "revoked"
+        assert agent.get_pending_count() == 0
+
+    def test_still_pending_stays_queued(self, agent, backend):
+        """Decisions still awaiting approval remain in the queue"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="needs_human",
+            reason="Needs review",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {})
+
+        results = agent.check_pending_approvals(lambda *a: pytest.fail("executed"))
+
+        assert results == []
+        assert agent.get_pending_count() == 1
+
+    def test_check_pending_approvals_async(self, agent, backend):
+        """Async variant executes approved actions concurrently"""
+        for i in (1, 2):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="approved",
+                reason="OK",
+                lease_id=f"lease-{i}",
+            )
+            agent.add_pending_approval(f"dec-{i}", "deploy", {"n": i})
+
+        async def callback(action_name, action_args, lease_id):
+            await asyncio.sleep(0)
+            return f"ran-{lease_id}"
+
+        results = asyncio.run(agent.check_pending_approvals_async(callback))
+
+        assert {r["status"] for r in results} == {"executed"}
+        assert {r["result"] for r in results} == {"ran-lease-1", "ran-lease-2"}
+        assert not agent.has_pending_approvals()
+
+    def test_removal_keeps_remaining_entries_intact(self, agent, backend):
+        """Resolving one entry leaves the rest addressable"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="denied",
+            reason="No",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {"n": 1})
+        agent.add_pending_approval("dec-2", "restart", {"n": 2})
+        agent.add_pending_approval("dec-3", "scale", {"n": 3})
+
+        agent.check_pending_approvals(lambda *a: None)
+
+        assert agent.get_pending_count() == 2
+        view = agent.pending_approvals
+        assert view["dec-2"].action_args == {"n": 2}
+        assert view["dec-3"].action_args == {"n": 3}
+
+    def test_concurrent_add_and_resolve(self, agent):
+        """Queueing and resolving on different threads stays consistent"""
+        rounds = 300
+
+        def resolver():
+            # Mimics a background ApprovalPoller resolving decisions
+            # while the owning thread keeps queueing new ones
+            for i in range(rounds):
+                dec_id = f"dec-b-{i}"
+                agent.add_pending_approval(dec_id, "deploy", {"i": i})
+                agent._resolve_statuses(
+                    {dec_id: ("denied", None)}, lambda *a: None
+                )
+
+        worker = threading.Thread(target=resolver)
+        worker.start()
+        for i in range(rounds):
+            agent.add_pending_approval(f"dec-a-{i}", "deploy", {"i": i})
+        worker.join()
+
+        assert agent.get_pending_count() == rounds
+        view = agent.pending_approvals
+        assert set(view) == {f"dec-a-{i}" for i in range(rounds)}
+        for i in range(rounds):
+            assert view[f"dec-a-{i}"].action_args == {"i": i}
+
+
+class TestApprovalPoller:
+    """Tests for the shared multi-agent poller"""
+
+    @pytest.fixture
+    def backend(self):
+        """Create backend with temp database"""
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        yield SQLiteAuditBackend(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def test_poll_once_resolves_across_agents(self, backend):
+        """One shared tick resolves decisions for every registered agent"""
+        agent_a = AsyncAgent(agent_id="agent-a", backend=backend)
+        agent_b = AsyncAgent(agent_id="agent-b", backend=backend)
+
+        backend.record_decision(
+            decision_id="dec-a",
+            agent_id="agent-a",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-a",
+        )
+        backend.record_decision(
+            decision_id="dec-b",
+            agent_id="agent-b",
+            action="restart",
+            outcome="denied",
+            reason="No",
+        )
+        agent_a.add_pending_approval("dec-a", "deploy", {})
+        agent_b.add_pending_approval("dec-b", "restart", {})
+
+        executed = []
+        poller = ApprovalPoller(backend)
+        poller.register(agent_a, lambda name, args, lease: executed.append(lease))
+        poller.register(agent_b, lambda *a: pytest.fail("denied action executed"))
+
+        results = poller.poll_once()
+
+        assert executed == ["lease-a"]
+        assert {r["status"] for r in results} == {"executed", "denied"}
+        assert not poller.has_pending()
+
+    def test_unregister_stops_polling_agent(self, backend):
+        """Unregistered agents are left out of shared ticks"""
+        agent = AsyncAgent(agent_id="agent-a", backend=backend)
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-a",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-1",
+        )
+        agent.add_pending_approval("dec-1", "deploy", {})
+
+        poller = ApprovalPoller(backend)
+        poller.register(agent, lambda *a: None)
+        poller.unregister(agent)
+
+        assert poller.poll_once() == []
+        assert agent.get_pending_count() == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
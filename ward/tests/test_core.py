@@ -162,6 +162,36 @@ class TestPolicy:
         # Doesn't match with wrong context
         assert not rule.matches("deploy", {"environment": "production"})
 
+    def test_scoped_rule_falls_through_to_later_rule(self):
+        """A scope-vetoed rule yields to a later matching rule"""
+        policy = Policy(
+            name="test",
+            rules=[
+                PolicyRule(
+                    name="staging_only",
+                    action_pattern=r"deploy",
+                    outcome=PolicyOutcome.ALLOW,
+                    reason="Staging deploy",
+                    scope_constraints={"environment": "staging"},
+                ),
+                PolicyRule(
+                    name="deploy_review",
+                    action_pattern=r"deploy",
+                    outcome=PolicyOutcome.NEEDS_HUMAN,
+                    reason="Other deploys need review",
+                ),
+            ],
+        )
+
+        outcome, _, rule = policy.evaluate("deploy", {"environment": "production"})
+        assert outcome == PolicyOutcome.NEEDS_HUMAN
+        assert rule.name == "deploy_review"
+
+        # Without context, scope constraints are ignored: first rule wins
+        outcome, _, rule = policy.evaluate("deploy")
+        assert outcome == PolicyOutcome.ALLOW
+        assert rule.name == "staging_only"
+
 
 class TestDecision:
     """Tests for Decision primitive"""
@@ -278,6 +308,22 @@ class TestAudit:
         cache_entries = log.get_entries_with_unknown("cache staleness")
         assert len(cache_entries) == 1
 
+    def test_get_recent_for_agent(self):
+        """Recent entries per agent come back newest first"""
+        log = AuditLog()
+        for i in range(5):
+            log.append(
+                AuditEntry.from_action(
+                    entry_id=str(i),
+                    agent_id="agent-1" if i % 2 == 0 else "agent-2",
+                    action="deploy",
+                )
+            )
+
+        recent = log.get_recent_for_agent("agent-1", limit=2)
+        assert [e.entry_id for e in recent] == ["4", "2"]
+        assert log.get_recent_for_agent("agent-x") == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,56 @@
+"""
+Tests for the persistent launcher pool
+"""
+
+import pytest
+import subprocess
+
+from ward.agent._launcher import _LauncherPool
+
+
+class TestLauncherPool:
+    """Tests for _LauncherPool command execution"""
+
+    @pytest.fixture
+    def pool(self):
+        """Create a single-worker pool"""
+        pool = _LauncherPool(size=1)
+        yield pool
+        pool.shutdown()
+
+    def test_runs_simple_command(self, pool):
+        """Plain argv commands execute on the worker"""
+        exit_code, stdout, stderr = pool.run("echo hello")
+
+        assert exit_code == 0
+        assert stdout.strip() == "hello"
+        assert stderr == ""
+
+    def test_runs_shell_command(self, pool):
+        """Commands with metacharacters still go through the shell"""
+        exit_code, stdout, _ = pool.run("echo a | tr a b")
+
+        assert exit_code == 0
+        assert stdout.strip() == "b"
+
+    def test_worker_is_reused(self, pool):
+        """Multiple commands run on the same worker process"""
+        for i in range(3):
+            exit_code, stdout, _ = pool.run(f"echo run-{i}")
+            assert exit_code == 0
+            assert stdout.strip() == f"run-{i}"
+
+    def test_failing_command_reports_exit_code(self, pool):
+        """Nonzero exit codes come back as-is"""
+        exit_code, _, _ = pool.run("false")
+
+        assert exit_code != 0
+
+    def test_timeout_raises(self, pool):
+        """Timeouts surface as subprocess.TimeoutExpired"""
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run("sleep 5", timeout=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -288,6 +288,428 @@ class TestSQLiteBackend:
         decisions = backend.get_decisions()
         assert decisions[0]["known_unknowns"] == []
 
+    def test_poll_decisions_batched(self, backend):
+        """poll_decisions returns status for many decisions in one call"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-1",
+        )
+        backend.record_decision(
+            decision_id="dec-2",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="denied",
+            reason="Not OK",
+        )
+        backend.record_decision(
+            decision_id="dec-3",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-3",
+        )
+        backend.record_revocation(
+            revocation_id="rev-1",
+            lease_id="lease-3",
+            agent_id="agent-1",
+            reason="human_override",
+            revoked_by="human",
+            description="Revoked",
+        )
+
+        backend.record_decision(
+            decision_id="dec-4",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="needs_human",
+            reason="Pending review",
+        )
+
+        statuses = backend.poll_decisions(
+            ["dec-1", "dec-2", "dec-3", "dec-4", "dec-missing"]
+        )
+
+        assert statuses["dec-1"] == ("approved", "lease-1")
+        assert statuses["dec-2"] == ("denied", None)
+        assert statuses["dec-3"] == ("revoked", "lease-3")
+        # Still-pending decisions are filtered out SQL-side
+        assert "dec-4" not in statuses
+        assert "dec-missing" not in statuses
+
+    def test_batched_writes_visible_after_flush(self, temp_db):
+        """batch_writes mode commits queued records and keeps reads consistent"""
+        backend = SQLiteAuditBackend(temp_db, batch_writes=True)
+
+        for i in range(10):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="approved",
+                reason="Test",
+            )
+        backend.record_action(
+            action_id="act-1",
+            agent_id="agent-1",
+            action="deploy",
+            status="success",
+        )
+
+        backend.flush()
+        assert backend.count_decisions() == 10
+        assert backend.count_actions() == 1
+
+        # Reads drain the queue themselves, no explicit flush needed
+        backend.record_decision(
+            decision_id="dec-extra",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="Test",
+        )
+        assert backend.count_decisions() == 11
+
+    def test_batched_writes_survive_bad_row(self, temp_db):
+        """A row the writer can't commit doesn't kill the writer thread"""
+        backend = SQLiteAuditBackend(temp_db, batch_writes=True)
+
+        backend.record_action(
+            action_id="act-1",
+            agent_id="agent-1",
+            action="deploy",
+            status="success",
+        )
+        backend.flush()
+
+        # Duplicate primary key fails the batch; the writer should keep
+        # draining the queue and keep the failed row inspectable
+        backend.record_action(
+            action_id="act-1",
+            agent_id="agent-1",
+            action="deploy",
+            status="success",
+        )
+        backend.record_action(
+            action_id="act-2",
+            agent_id="agent-1",
+            action="deploy",
+            status="success",
+        )
+
+        # Reads flush first; this would hang forever with a dead writer
+        assert backend.count_actions() == 2
+        assert len(backend.write_errors) == 1
+
+    def test_get_decision_by_id(self, backend):
+        """Single-decision lookup returns one row or None"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="Test",
+            lease_id="lease-1",
+        )
+
+        decision = backend.get_decision("dec-1")
+        assert decision["id"] == "dec-1"
+        assert decision["lease_id"] == "lease-1"
+
+        assert backend.get_decision("dec-missing") is None
+
+    def test_get_decisions_by_ids(self, temp_db):
+        """Batched ID lookup preserves request order across chunks"""
+        backend = SQLiteAuditBackend(temp_db, batch_writes=True)
+
+        # Enough rows to force a second 500-placeholder chunk
+        total = 505
+        for i in range(total):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="approved",
+                reason="Test",
+            )
+
+        requested = [f"dec-{i}" for i in range(total - 1, -1, -1)]
+        decisions = backend.get_decisions_by_ids(requested)
+        assert [d["id"] for d in decisions] == requested
+        assert decisions[0]["agent_id"] == "agent-1"
+
+        # Unknown IDs are skipped, not errors
+        sparse = backend.get_decisions_by_ids(["dec-missing", "dec-3", "dec-1"])
+        assert [d["id"] for d in sparse] == ["dec-3", "dec-1"]
+
+        assert backend.get_decisions_by_ids([]) == []
+
+    def test_get_pending_decision(self, backend):
+        """Pending lookup only matches unprocessed needs_human decisions"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="needs_human",
+            reason="Review",
+        )
+        backend.record_decision(
+            decision_id="dec-2",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+        )
+
+        assert backend.get_pending_decision("dec-1")["id"] == "dec-1"
+        assert backend.get_pending_decision("dec-2") is None
+
+        # Processed decisions no longer count as pending
+        backend.record_human_approval(
+            approval_id="ha-1",
+            decision_id="dec-1",
+            human_outcome="approved",
+        )
+        assert backend.get_pending_decision("dec-1") is None
+
+    def test_list_active_leases(self, backend):
+        """Active-lease listing excludes revoked and expired leases"""
+        for i, lease in enumerate(("lease-1", "lease-2", "lease-3"), start=1):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="approved",
+                reason="OK",
+                lease_id=lease,
+            )
+
+        far_future = "2999-01-01T00:00:00"
+        backend.record_action(
+            action_id="act-1",
+            agent_id="human:cli",
+            action="approve_decision",
+            status="approved",
+            result={"lease_id": "lease-1", "max_steps": 3, "expires_at": far_future},
+        )
+        # lease-2 expired long ago
+        backend.record_action(
+            action_id="act-2",
+            agent_id="human:cli",
+            action="approve_decision",
+            status="approved",
+            result={"lease_id": "lease-2", "max_steps": 1, "expires_at": "2000-01-01T00:00:00"},
+        )
+        # lease-3 revoked
+        backend.record_revocation(
+            revocation_id="rev-1",
+            lease_id="lease-3",
+            agent_id="agent-1",
+            reason="human_override",
+            revoked_by="human",
+            description="Revoked",
+        )
+
+        leases = backend.list_active_leases(datetime.now().isoformat())
+
+        assert len(leases) == 1
+        assert leases[0]["lease_id"] == "lease-1"
+        assert leases[0]["max_steps"] == 3
+        assert leases[0]["expires_at"] == far_future
+
+    def test_apply_human_decisions_batch(self, backend):
+        """Batched approve/deny writes all three tables in one call"""
+        for i in (1, 2):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="needs_human",
+                reason="Review",
+            )
+
+        backend.apply_human_decisions(
+            decision_updates=[
+                ("approved", "lease-1", "dec-1"),
+                ("denied", None, "dec-2"),
+            ],
+            actions=[
+                dict(
+                    action_id="act-1",
+                    agent_id="human:cli",
+                    action="approve_decision",
+                    status="approved",
+                    result={"lease_id": "lease-1"},
+                    tags=["approval", "human", "batch"],
+                ),
+                dict(
+                    action_id="act-2",
+                    agent_id="human:cli",
+                    action="deny_decision",
+                    status="denied",
+                    tags=["denial", "human", "batch"],
+                ),
+            ],
+            approvals=[
+                dict(
+                    approval_id="ha-1",
+                    decision_id="dec-1",
+                    human_outcome="approved",
+                    recommended_max_steps=1,
+                    actual_max_steps=3,
+                ),
+                dict(
+                    approval_id="ha-2",
+                    decision_id="dec-2",
+                    human_outcome="denied",
+                ),
+            ],
+        )
+
+        assert backend.get_decision("dec-1")["outcome"] == "approved"
+        assert backend.get_decision("dec-1")["lease_id"] == "lease-1"
+        assert backend.get_decision("dec-2")["outcome"] == "denied"
+        assert backend.count_actions() == 2
+
+        approvals = backend.get_human_approvals()
+        assert len(approvals) == 2
+        modified = {a["id"]: a["constraints_modified"] for a in approvals}
+        assert modified == {"ha-1": True, "ha-2": False}
+
+    def test_bulk_record_helpers(self, backend):
+        """Multi-row bulk inserts round-trip through the normal readers"""
+        # Large enough to span multiple chunked INSERT statements
+        backend.record_actions_bulk(
+            [
+                dict(
+                    action_id=f"act-{i}",
+                    agent_id="agent-1",
+                    action="deploy",
+                    status="success",
+                    tags=["batch"],
+                )
+                for i in range(250)
+            ]
+        )
+        backend.record_human_approvals_bulk(
+            [
+                dict(
+                    approval_id=f"ha-{i}",
+                    decision_id=f"dec-{i}",
+                    human_outcome="approved",
+                )
+                for i in range(100)
+            ]
+        )
+
+        assert backend.count_actions() == 250
+        approvals = backend.get_human_approvals()
+        assert len(approvals) == 100
+        assert approvals[0]["human_outcome"] == "approved"
+
+    def test_get_revocations_since(self, backend):
+        """Timestamp cutoff filters revocations SQL-side"""
+        from datetime import timedelta
+
+        old = datetime.now() - timedelta(hours=48)
+        backend.record_revocation(
+            revocation_id="rev-old",
+            lease_id="lease-1",
+            agent_id="agent-1",
+            reason="human_override",
+            revoked_by="human",
+            description="Old",
+            timestamp=old,
+        )
+        backend.record_revocation(
+            revocation_id="rev-new",
+            lease_id="lease-2",
+            agent_id="agent-1",
+            reason="human_override",
+            revoked_by="human",
+            description="New",
+        )
+
+        cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
+        recent = backend.get_revocations_since(cutoff)
+
+        assert [r["id"] for r in recent] == ["rev-new"]
+
+    def test_count_active_leases(self, backend):
+        """Only approved decisions with a lease are counted"""
+        backend.record_decision(
+            decision_id="dec-1",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",
+            lease_id="lease-1",
+        )
+        backend.record_decision(
+            decision_id="dec-2",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="approved",
+            reason="OK",  # No lease
+        )
+        backend.record_decision(
+            decision_id="dec-3",
+            agent_id="agent-1",
+            action="deploy",
+            outcome="denied",
+            reason="No",
+        )
+
+        assert backend.count_active_leases() == 1
+
+    def test_pending_approvals_pagination(self, backend):
+        """Pending approvals respect limit/offset and count SQL-side"""
+        for i in range(5):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="needs_human",
+                reason="Review",
+            )
+
+        assert backend.count_pending_approvals() == 5
+        assert len(backend.get_pending_approvals(limit=2)) == 2
+        page2 = backend.get_pending_approvals(limit=2, offset=2)
+        assert len(page2) == 2
+        assert len(backend.get_pending_approvals(limit=2, offset=4)) == 1
+
+    def test_get_decision_intel_many(self, backend):
+        """Batched DIR fetch returns a map keyed by decision_id"""
+        for i in (1, 2):
+            backend.record_decision(
+                decision_id=f"dec-{i}",
+                agent_id="agent-1",
+                action="deploy",
+                outcome="needs_human",
+                reason="Review",
+            )
+            backend.store_decision_intel(
+                decision_id=f"dec-{i}",
+                payload={"risk_assessment": {"risk_level": "low"}},
+                generated_at=datetime.now().isoformat(),
+                generator="rules",
+            )
+
+        intel = backend.get_decision_intel_many(["dec-1", "dec-2", "dec-missing"])
+
+        assert set(intel) == {"dec-1", "dec-2"}
+        assert intel["dec-1"]["payload"]["risk_assessment"]["risk_level"] == "low"
+        assert backend.get_decision_intel_many([]) == {}
+
+    def test_poll_decisions_empty(self, backend):
+        """poll_decisions handles an empty ID list"""
+        assert backend.poll_decisions([]) == {}
+
     def test_none_optional_fields(self, backend):
         """None values for optional fields are handled"""
         backend.record_decision(